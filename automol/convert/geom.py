@@ -221,11 +221,9 @@ def from_subset(geo, idxs):
         :rtype: automol moleculer geometry data structure
     """
 
-    symbs = symbols(geo)
-    xyzs = coordinates(geo)
-
-    symbs = list(map(symbs.__getitem__, idxs))
-    xyzs = list(map(xyzs.__getitem__, idxs))
+    rows = list(map(geo.__getitem__, idxs))
+    symbs = [sym for sym, _ in rows]
+    xyzs = [xyz for _, xyz in rows]
 
     return automol.create.geom.from_data(symbs, xyzs)
 
@@ -335,16 +333,24 @@ def linear_atoms(geo, gra=None, tol=5.):
     gra = connectivity_graph(geo) if gra is None else gra
     ngb_idxs_dct = atoms_neighbor_atom_keys(gra)
 
-    lin_idxs = []
-    for idx in range(count(geo)):
-        nidxs = ngb_idxs_dct[idx]
-        if len(nidxs) >= 2:
-            for nidx1, nidx2 in itertools.combinations(nidxs, 2):
-                ang = central_angle(geo, nidx1, idx, nidx2, degree=True)
-                if numpy.abs(ang - 180.) < tol:
-                    lin_idxs.append(idx)
-
-    lin_idxs = tuple(lin_idxs)
+    # Gather every (neighbor, atom, neighbor) triplet and measure all of the
+    # central angles at once
+    trip_idxs = [(nidx1, idx, nidx2) for idx in range(count(geo))
+                 for nidx1, nidx2 in itertools.combinations(
+                     ngb_idxs_dct[idx], 2)]
+    if not trip_idxs:
+        return ()
+
+    xyzs = numpy.array(coordinates(geo))
+    idxs1, idxs2, idxs3 = numpy.transpose(trip_idxs)
+    vecs21 = xyzs[idxs1] - xyzs[idxs2]
+    vecs23 = xyzs[idxs3] - xyzs[idxs2]
+    coss = (numpy.einsum('ij,ij->i', vecs21, vecs23) /
+            numpy.linalg.norm(vecs21, axis=1) /
+            numpy.linalg.norm(vecs23, axis=1))
+    angs = numpy.arccos(numpy.clip(coss, -1., 1.)) * phycon.RAD2DEG
+
+    lin_idxs = tuple(idxs2[numpy.abs(angs - 180.) < tol].tolist())
 
     return lin_idxs
 
@@ -22,9 +22,6 @@ from automol.convert.geom import graph as geom_graph
 from automol.convert.geom import connectivity_graph as geom_connectivity_graph
 from automol.convert.geom import from_subset
 from automol.convert.geom import insert_dummies_on_linear_atoms
-from automol.convert.geom import central_angle as _central_angle
-from automol.convert.geom import dihedral_angle as _dihedral_angle
-from automol.convert.geom import distance as _distance
 from automol.graph.geom import symbols as geom_symbols
 
 
@@ -389,20 +386,43 @@ def from_geometry(vma, geo):
         :type geo: automol molecular geometry data structure
         :rtype: automol Z-Matrix data structure
     """
-    assert symbols(vma) == symbols(geo)
+    return from_geometry_subset(vma, geo, range(len(geo)))
+
+
+def from_geometry_subset(vma, geo, idxs):
+    """  Build a Z-Matrix from a V-Matrix and a subset of the atoms in a
+        molecular geometry, without building the subset geometry.
+
+        :param vma: V-Matrix
+        :type vma: automol V-Matrix data structure
+        :param geo: molecular geometry
+        :type geo: automol molecular geometry data structure
+        :param idxs: indices of the geometry atoms, in V-Matrix order
+        :type idxs: tuple(int)
+        :rtype: automol Z-Matrix data structure
+    """
+    idxs = tuple(idxs)
+    geo_syms, geo_xyzs = zip(*geo) if geo else ((), ())
+    xyzs = tuple(map(geo_xyzs.__getitem__, idxs))
 
     syms = symbols(vma)
+    assert syms == tuple(map(geo_syms.__getitem__, idxs))
+
     key_mat = key_matrix(vma)
     name_mat = name_matrix(vma)
     val_mat = numpy.empty(numpy.shape(key_mat), dtype=numpy.object_)
 
     for row, key_row in enumerate(key_mat):
+        xyz = xyzs[row]
         if row > 0:
-            val_mat[row, 0] = _distance(geo, row, *key_row[:1])
+            val_mat[row, 0] = util.vec.distance(
+                xyz, *map(xyzs.__getitem__, key_row[:1]))
         if row > 1:
-            val_mat[row, 1] = _central_angle(geo, row, *key_row[:2])
+            val_mat[row, 1] = util.vec.central_angle(
+                xyz, *map(xyzs.__getitem__, key_row[:2]))
         if row > 2:
-            val_mat[row, 2] = _dihedral_angle(geo, row, *key_row[:3])
+            val_mat[row, 2] = util.vec.dihedral_angle(
+                xyz, *map(xyzs.__getitem__, key_row[:3]))
 
     zma = create.zmat.from_data(syms, key_mat, val_mat, name_mat)
     return zma
@@ -80,6 +80,7 @@ from automol.graph._embed_dep import atom_shortest_paths
 from automol.graph._embed_dep import closest_approach
 from automol.graph._embed_dep import backbone_isomorphic
 from automol.graph._embed_dep import backbone_isomorphism
+from automol.graph._embed_dep import color_refinement_hash
 from automol.graph._embed_dep import transform_keys
 from automol.graph._embed_dep import union
 # rings
@@ -359,6 +360,7 @@ __all__ = [
     'closest_approach',
     'backbone_isomorphic',
     'backbone_isomorphism',
+    'color_refinement_hash',
     'transform_keys',
     'union',
 
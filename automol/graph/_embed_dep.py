@@ -1,6 +1,8 @@
 """ objects that everything else depends on
 """
+import hashlib
 import itertools
+import functools
 import numpy
 from phydat import phycon
 from phydat import ptab
@@ -27,6 +29,8 @@ from automol.graph._graph_dep import subgraph
 from automol.graph._graph_dep import atom_stereo_sorted_neighbor_atom_keys
 from automol.graph._graph_dep import resonance_dominant_atom_hybridizations
 from automol.graph._graph_dep import sp2_bond_keys
+from automol.graph._util import freeze
+from automol.graph._util import thaw
 # stereo
 from automol.graph._graph_dep import atom_stereo_keys
 from automol.graph._graph_dep import bond_stereo_keys
@@ -735,9 +739,68 @@ def backbone_isomorphism(gra1, gra2, igraph=False):
 
     for implicit graphs, this is the relabeling of `gra1` to produce `gra2`
     for other graphs, it gives the correspondences between backbone atoms
+
+    (Results are cached on the implicit graphs, so repeated comparisons
+    between the same pair of graphs are only run once)
     """
     gra1 = implicit(gra1)
     gra2 = implicit(gra2)
+    iso_dct = _backbone_isomorphism(
+        freeze(gra1), freeze(gra2), igraph)
+    return None if iso_dct is None else dict(iso_dct)
+
+
+def color_refinement_hash(gra):
+    """ an isomorphism-invariant hash of a graph, from color refinement
+
+    Each atom starts out colored by its atom value. At each step, the atom's
+    color is combined with the colors of its neighbors and the values of the
+    bonds connecting them, until the number of distinct colors stops growing.
+    Isomorphic graphs always give the same hash, so differing hashes prove
+    that two graphs are not isomorphic.
+
+    The colors are SHA-1 digests rather than values of the built-in `hash()`,
+    so the result doesn't depend on the interpreter's hash seed and can be
+    compared between processes.
+
+    :param gra: the graph
+    :returns: the hash, as a hexadecimal string
+    :rtype: str
+    """
+    atm_ngb_keys_dct = atoms_neighbor_atom_keys(gra)
+    bnd_dct = bonds(gra)
+
+    col_dct = {k: _stable_hash(v) for k, v in atoms(gra).items()}
+    ncols = None
+    while len(set(col_dct.values())) != ncols:
+        ncols = len(set(col_dct.values()))
+        col_dct = {
+            k: _stable_hash((c, sorted(
+                (repr(bnd_dct[frozenset({k, n})]), col_dct[n])
+                for n in atm_ngb_keys_dct[k])))
+            for k, c in col_dct.items()}
+
+    return _stable_hash(sorted(col_dct.values()))
+
+
+def _stable_hash(obj):
+    """ a hash of an object's representation that doesn't vary between
+    processes
+    """
+    return hashlib.sha1(repr(obj).encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=256)
+def _backbone_isomorphism(frz_gra1, frz_gra2, igraph):
+    """ backbone isomorphism between two graphs in hashable form
+    """
+    gra1 = thaw(frz_gra1)
+    gra2 = thaw(frz_gra2)
+
+    # Cheaply rule out most non-isomorphic pairs before running the matcher
+    if color_refinement_hash(gra1) != color_refinement_hash(gra2):
+        return None
+
     if igraph:
         igr1 = _igraph.from_graph(gra1)
         igr2 = _igraph.from_graph(gra2)
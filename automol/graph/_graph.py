@@ -7,6 +7,7 @@ import functools
 import numpy
 from phydat import ptab
 import automol.formula
+import automol.create as _create
 from automol.util import dict_
 from automol.graph._graph_dep import atoms
 from automol.graph._graph_dep import bonds
@@ -26,15 +27,13 @@ from automol.graph._graph_dep import explicit
 from automol.graph._graph_dep import add_atoms
 from automol.graph._graph_dep import atom_unsaturated_valences
 from automol.graph._graph_dep import maximum_spin_multiplicity
-from automol.graph._graph_dep import atom_neighborhoods
-from automol.graph._graph_dep import bond_neighborhoods
 from automol.graph._graph_dep import atoms_neighbor_atom_keys
 from automol.graph._graph_dep import subgraph
 from automol.graph._graph_dep import bond_induced_subgraph
 from automol.graph._graph_dep import dummy_atoms_neighbor_atom_key
 from automol.graph._embed_dep import atom_shortest_paths
-from automol.graph._embed_dep import union
 from automol.graph._embed_dep import backbone_isomorphic
+from automol.graph._embed_dep import color_refinement_hash
 # graphbase
 from automol.graph import _networkx
 from automol.graph import _igraph
@@ -143,8 +142,14 @@ def frozen(gra):
 def electron_count(gra, charge=0):
     """ the number of electrons in the molecule
     """
-    atm_symb_dct = atom_symbols(explicit(gra))
-    nelec = sum(map(ptab.to_number, atm_symb_dct.values())) - charge
+    atm_symb_dct = atom_symbols(gra)
+    atm_imp_hyd_vlc_dct = atom_implicit_hydrogen_valences(gra)
+    # count each implicit hydrogen as one electron, rather than making the
+    # hydrogens explicit
+    symb_num_dct = {symb: ptab.to_number(symb)
+                    for symb in set(atm_symb_dct.values())}
+    nelec = (sum(map(symb_num_dct.__getitem__, atm_symb_dct.values())) +
+             sum(atm_imp_hyd_vlc_dct.values()) - charge)
     return nelec
 
 
@@ -206,7 +211,13 @@ def atoms_second_degree_neighbor_atom_keys(gra):
 def atoms_bond_keys(gra):
     """ bond keys, by atom
     """
-    return dict_.transform_values(atom_neighborhoods(gra), bond_keys)
+    atm_bnd_keys_dct = {k: set() for k in atom_keys(gra)}
+    for bnd_key in bond_keys(gra):
+        for atm_key in bnd_key:
+            atm_bnd_keys_dct[atm_key].add(bnd_key)
+
+    atm_bnd_keys_dct = dict_.transform_values(atm_bnd_keys_dct, frozenset)
+    return atm_bnd_keys_dct
 
 
 def angle_keys(gra):
@@ -231,25 +242,30 @@ def angle_keys(gra):
 def bonds_neighbor_atom_keys(gra):
     """ keys of neighboring atoms, by bond
     """
-    def _neighbor_keys(bnd_key, bnd_nbh):
-        return frozenset(atom_keys(bnd_nbh) - bnd_key)
+    atm_ngb_keys_dct = atoms_neighbor_atom_keys(gra)
 
-    bnd_ngb_keys_dct = dict_.transform_items_to_values(
-        bond_neighborhoods(gra), _neighbor_keys)
+    def _neighbor_keys(bnd_key):
+        atm1_key, atm2_key = bnd_key
+        return (atm_ngb_keys_dct[atm1_key] | atm_ngb_keys_dct[atm2_key]
+                ) - bnd_key
+
+    bnd_keys = bond_keys(gra)
+    bnd_ngb_keys_dct = dict(zip(bnd_keys, map(_neighbor_keys, bnd_keys)))
     return bnd_ngb_keys_dct
 
 
 def bonds_neighbor_bond_keys(gra):
     """ keys of neighboring bonds, by bond
     """
-    def _neighbor_keys(bnd_key, bnd_nbh):
-        bnd_keys = bond_keys(bnd_nbh)
-        bnd_keys -= {bnd_key}
-        bnd_keys = frozenset(key for key in bnd_keys if key & bnd_key)
-        return bnd_keys
+    atm_bnd_keys_dct = atoms_bond_keys(gra)
 
-    bnd_ngb_keys_dct = dict_.transform_items_to_values(
-        bond_neighborhoods(gra), _neighbor_keys)
+    def _neighbor_keys(bnd_key):
+        atm1_key, atm2_key = bnd_key
+        return (atm_bnd_keys_dct[atm1_key] | atm_bnd_keys_dct[atm2_key]
+                ) - {bnd_key}
+
+    bnd_keys = bond_keys(gra)
+    bnd_ngb_keys_dct = dict(zip(bnd_keys, map(_neighbor_keys, bnd_keys)))
     return bnd_ngb_keys_dct
 
 
@@ -295,20 +311,18 @@ def branch_bond_keys(gra, atm_key, bnd_key):
     atm_bnd_keys_dct = atoms_bond_keys(gra)
 
     bnch_bnd_keys = {bnd_key}
-    seen_bnd_keys = set()
     excl_bnd_keys = atm_bnd_keys_dct[atm_key] - {bnd_key}
 
     new_bnd_keys = {bnd_key}
 
-    bnd_ngb_keys_dct = bonds_neighbor_bond_keys(gra)
-
+    # Step outward through the atoms of the newest bonds, only visiting the
+    # bonds of the atoms reached so far
     while new_bnd_keys:
-        new_bnd_ngb_keys = set(
-            itertools.chain(
-                *dict_.values_by_key(bnd_ngb_keys_dct, new_bnd_keys)))
-        bnch_bnd_keys.update(new_bnd_ngb_keys - excl_bnd_keys)
-        seen_bnd_keys.update(new_bnd_keys)
-        new_bnd_keys = bnch_bnd_keys - seen_bnd_keys
+        new_atm_keys = set(itertools.chain(*new_bnd_keys))
+        new_bnd_keys = set(itertools.chain(
+            *map(atm_bnd_keys_dct.__getitem__, new_atm_keys)))
+        new_bnd_keys -= excl_bnd_keys | bnch_bnd_keys
+        bnch_bnd_keys.update(new_bnd_keys)
 
     return frozenset(bnch_bnd_keys)
 
@@ -316,7 +330,7 @@ def branch_bond_keys(gra, atm_key, bnd_key):
 def is_connected(gra):
     """ is this a connected graph
     """
-    return len(connected_components(gra)) == 1
+    return len(connected_components_atom_keys(gra)) == 1
 
 
 def connected_components(gra):
@@ -427,10 +441,17 @@ def atom_longest_chain(gra, atm_key):
 def union_from_sequence(gras, check=True):
     """ a union of all parts of a sequence of graphs
     """
-    def _union(gra1, gra2):
-        return union(gra1, gra2, check=check)
+    # merge everything into one pair of dictionaries and build the graph
+    # once, instead of rebuilding it for each pairwise union
+    atm_dct = {}
+    bnd_dct = {}
+    for gra in gras:
+        if check:
+            assert not atom_keys(gra) & atm_dct.keys()
+        atm_dct.update(atoms(gra))
+        bnd_dct.update(bonds(gra))
 
-    return tuple(functools.reduce(_union, gras))
+    return tuple(_create.graph.from_atoms_and_bonds(atm_dct, bnd_dct))
 
 
 # # transformations
@@ -690,16 +711,26 @@ def full_subgraph_isomorphism(gra1, gra2):
 def backbone_unique(gras):
     """ unique non-isomorphic graphs from a series
     """
-    gras = _unique(gras, equiv=backbone_isomorphic)
+    def _hash(gra):
+        return color_refinement_hash(implicit(gra))
+
+    gras = _unique(gras, equiv=backbone_isomorphic, key=_hash)
     return gras
 
 
-def _unique(itms, equiv):
+def _unique(itms, equiv, key=None):
     """ unique items from a list, according to binary comparison `equiv`
+
+    if `key` is given, items with different keys are taken to be inequivalent,
+    so that each item is only compared against those with a matching key
     """
     uniq_itms = []
+    uniq_itms_dct = {}
     for itm in itms:
-        if not any(map(functools.partial(equiv, itm), uniq_itms)):
+        itm_key = None if key is None else key(itm)
+        cands = uniq_itms_dct.setdefault(itm_key, [])
+        if not any(map(functools.partial(equiv, itm), cands)):
+            cands.append(itm)
             uniq_itms.append(itm)
 
     return tuple(uniq_itms)
@@ -741,42 +772,25 @@ def bond_symmetry_numbers(gra, frm_bnd_key=None, brk_bnd_key=None):
 
     tfr_atm = None
     if frm_bnd_key and brk_bnd_key:
-        for atm_f in list(frm_bnd_key):
-            for atm_b in list(brk_bnd_key):
-                if atm_f == atm_b:
-                    tfr_atm = atm_f
-
-        if tfr_atm:
-            neighbor_dct = atoms_neighbor_atom_keys(gra)
-            nei_tfr = neighbor_dct[tfr_atm]
-
-            atms = gra[0]
-            all_hyds = []
-            for atm in atms:
-                if atms[atm][0] == 'H':
-                    all_hyds.append(atm)
-        else:
-            nei_tfr = {}
+        for atm_f in frm_bnd_key:
+            if atm_f in brk_bnd_key:
+                tfr_atm = atm_f
+
+    # the symmetry number for a methyl rotor, which is reduced to 1 if the
+    # transferring atom neighbors a methyl group; this is the same for every
+    # bond, so it only needs to be determined once
+    ch3_sym = 3
+    if tfr_atm:
+        hyd_keys = dict_.keys_by_value(atom_symbols(gra), lambda x: x == 'H')
+        ngb_keys_dct = atoms_neighbor_atom_keys(gra)
+        if any(len(ngb_keys_dct[k] & hyd_keys) == 3
+               for k in ngb_keys_dct[tfr_atm]):
+            ch3_sym = 1
 
     bnd_symb_num_dct = {}
-    bnd_symb_nums = []
     for bnd_key in bnd_keys:
-        bnd_sym = 1
         vlc = max(map(atm_imp_hyd_vlc_dct.__getitem__, bnd_key))
-        if vlc == 3:
-            bnd_sym = 3
-            if tfr_atm:
-                for atm in nei_tfr:
-                    nei_s = neighbor_dct[atm]
-                    h_nei = 0
-                    for nei in nei_s:
-                        if nei in all_hyds:
-                            h_nei += 1
-                    if h_nei == 3:
-                        bnd_sym = 1
-        bnd_symb_nums.append(bnd_sym)
-
-    bnd_symb_num_dct = dict(zip(bnd_keys, bnd_symb_nums))
+        bnd_symb_num_dct[bnd_key] = ch3_sym if vlc == 3 else 1
 
     # fill in the rest of the bonds for completeness
     bnd_symb_num_dct = dict_.by_key(
@@ -1,7 +1,6 @@
 """ objects that everything else depends on
 """
 import itertools
-import functools
 import numpy
 import yaml
 import future.moves.itertools as fmit
@@ -114,14 +113,18 @@ def atom_bond_valences(gra, bond_order=True):
     """ bond count (bond valence), by atom
     """
     atm_keys = list(atom_keys(gra))
-    gra = explicit(gra)
     if not bond_order:
         gra = without_bond_orders(gra)
 
-    atm_nbhs = dict_.values_by_key(atom_neighborhoods(gra), atm_keys)
-    atm_bnd_vlcs = [sum(bond_orders(nbh).values()) for nbh in atm_nbhs]
-    atm_bnd_vlc_dct = dict_.transform_values(
-        dict(zip(atm_keys, atm_bnd_vlcs)), int)
+    # implicit hydrogens each contribute a single bond, so there is no need
+    # to make them explicit
+    atm_bnd_vlc_dct = dict_.by_key(atom_implicit_hydrogen_valences(gra),
+                                   atm_keys)
+    for bnd_key, bnd_ord in bond_orders(gra).items():
+        for atm_key in bnd_key:
+            atm_bnd_vlc_dct[atm_key] += bnd_ord
+
+    atm_bnd_vlc_dct = dict_.transform_values(atm_bnd_vlc_dct, int)
     return atm_bnd_vlc_dct
 
 
@@ -151,10 +154,13 @@ def explicit(gra, atm_keys=None):
 def implicit(gra, atm_keys=None):
     """ make the hydrogens at these atoms implicit
     """
-    atm_keys = backbone_keys(gra) if atm_keys is None else atm_keys
+    atm_exp_hyd_keys_dct = atom_explicit_hydrogen_keys(gra)
+    if atm_keys is None:
+        exp_hyd_keys = frozenset(
+            itertools.chain(*atm_exp_hyd_keys_dct.values()))
+        atm_keys = atom_keys(gra) - exp_hyd_keys
 
-    atm_exp_hyd_keys_dct = dict_.by_key(
-        atom_explicit_hydrogen_keys(gra), atm_keys)
+    atm_exp_hyd_keys_dct = dict_.by_key(atm_exp_hyd_keys_dct, atm_keys)
 
     inc_imp_hyd_keys_dct = dict_.transform_values(atm_exp_hyd_keys_dct, len)
     gra = add_atom_implicit_hydrogen_valences(gra, inc_imp_hyd_keys_dct)
@@ -279,9 +285,10 @@ def set_bond_orders(rgr, bnd_ord_dct):
 def atom_explicit_hydrogen_keys(gra):
     """ explicit hydrogen valences, by atom
     """
-    exp_hyd_keys = explicit_hydrogen_keys(gra)
+    atm_ngb_keys_dct = atoms_neighbor_atom_keys(gra)
+    exp_hyd_keys = _explicit_hydrogen_keys(gra, atm_ngb_keys_dct)
     atm_exp_hyd_keys_dct = dict_.transform_values(
-        atoms_neighbor_atom_keys(gra), lambda x: x & exp_hyd_keys)
+        atm_ngb_keys_dct, lambda x: x & exp_hyd_keys)
     return atm_exp_hyd_keys_dct
 
 
@@ -325,13 +332,20 @@ def add_atom_explicit_hydrogen_keys(gra, atm_exp_hyd_keys_dct):
         '{} !<= {}'.format(
             set(atm_exp_hyd_keys_dct.keys()), atom_keys(gra))
     )
+    # collect the hydrogens first and add them all at once, rather than
+    # rebuilding the graph for each atom
+    atm_keys = atom_keys(gra)
+    exp_hyd_keys = set()
+    exp_hyd_bnd_keys = set()
     for atm_key, atm_exp_hyd_keys in atm_exp_hyd_keys_dct.items():
-        assert not set(atm_exp_hyd_keys) & atom_keys(gra)
-        atm_exp_hyd_bnd_keys = {frozenset({atm_key, atm_exp_hyd_key})
-                                for atm_exp_hyd_key in atm_exp_hyd_keys}
-        atm_exp_hyd_symb_dct = dict_.by_key({}, atm_exp_hyd_keys, fill_val='H')
-        gra = add_atoms(gra, atm_exp_hyd_symb_dct)
-        gra = add_bonds(gra, atm_exp_hyd_bnd_keys)
+        assert not set(atm_exp_hyd_keys) & (atm_keys | exp_hyd_keys)
+        exp_hyd_keys.update(atm_exp_hyd_keys)
+        exp_hyd_bnd_keys.update(frozenset({atm_key, atm_exp_hyd_key})
+                                for atm_exp_hyd_key in atm_exp_hyd_keys)
+
+    exp_hyd_symb_dct = dict_.by_key({}, exp_hyd_keys, fill_val='H')
+    gra = add_atoms(gra, exp_hyd_symb_dct)
+    gra = add_bonds(gra, exp_hyd_bnd_keys)
     return gra
 
 
@@ -362,8 +376,13 @@ def maximum_spin_multiplicity(gra, bond_order=True):
 def explicit_hydrogen_keys(gra):
     """ explicit hydrogen keys (H types: explicit, implicit, backbone)
     """
+    return _explicit_hydrogen_keys(gra, atoms_neighbor_atom_keys(gra))
+
+
+def _explicit_hydrogen_keys(gra, atm_ngb_keys_dct):
+    """ explicit hydrogen keys, given the neighbor keys of each atom
+    """
     hyd_keys = dict_.keys_by_value(atom_symbols(gra), lambda x: x == 'H')
-    atm_ngb_keys_dct = atoms_neighbor_atom_keys(gra)
 
     def _is_backbone(hyd_key):
         is_h2 = all(ngb_key in hyd_keys and hyd_key < ngb_key
@@ -447,9 +466,11 @@ def atom_element_valences(gra):
     """ element valences (# possible single bonds), by atom
     """
     atm_symb_dct = atom_symbols(gra)
-    atm_group_idx_dct = dict_.transform_values(atm_symb_dct, ptab.to_group)
-    atm_elem_vlc_dct = dict_.transform_values(atm_group_idx_dct,
-                                              VALENCE_DCT.__getitem__)
+    # look each element up once, rather than once per atom
+    symb_elem_vlc_dct = {symb: VALENCE_DCT[ptab.to_group(symb)]
+                         for symb in set(atm_symb_dct.values())}
+    atm_elem_vlc_dct = dict_.transform_values(atm_symb_dct,
+                                              symb_elem_vlc_dct.__getitem__)
     return atm_elem_vlc_dct
 
 
@@ -465,12 +486,16 @@ def atom_neighbor_atom_key(gra, atm_key, excl_atm_keys=(), incl_atm_keys=None,
 
 def atoms_neighbor_atom_keys(gra):
     """ keys of neighboring atoms, by atom
+
+    (Built in a single pass over the bonds, rather than by constructing a
+    neighborhood subgraph for each atom)
     """
-    def _neighbor_keys(atm_key, atm_nbh):
-        return frozenset(atom_keys(atm_nbh) - {atm_key})
+    atm_ngb_keys_dct = {k: set() for k in atom_keys(gra)}
+    for atm1_key, atm2_key in bond_keys(gra):
+        atm_ngb_keys_dct[atm1_key].add(atm2_key)
+        atm_ngb_keys_dct[atm2_key].add(atm1_key)
 
-    atm_ngb_keys_dct = dict_.transform_items_to_values(
-        atom_neighborhoods(gra), _neighbor_keys)
+    atm_ngb_keys_dct = dict_.transform_values(atm_ngb_keys_dct, frozenset)
     return atm_ngb_keys_dct
 
 
@@ -566,9 +591,10 @@ def dominant_resonances(rgr):
     """
     rgr = without_fractional_bonds(rgr)
     rgrs = resonances(rgr)
-    mult_min = min(map(maximum_spin_multiplicity, rgrs))
+    mults = tuple(map(maximum_spin_multiplicity, rgrs))
+    mult_min = min(mults)
     dom_rgrs = tuple(
-        rgr for rgr in rgrs if maximum_spin_multiplicity(rgr) == mult_min)
+        rgr for rgr, mult in zip(rgrs, mults) if mult == mult_min)
     return dom_rgrs
 
 
@@ -589,7 +615,8 @@ def subresonances(rgr):
     ret_rgrs = []
     if bnd_cap_dct:
         bnd_keys, bnd_caps = zip(*bnd_cap_dct.items())
-        atm_keys = list(functools.reduce(frozenset.union, bnd_keys))
+        bnd_ord_dct = bond_orders(rgr)
+        atm_unsat_vlc_dct = atom_unsaturated_valences(rgr)
 
         # Loop over all possible combinations of bond order increments (amounts
         # by which to increase the bond order), filtering out combinations that
@@ -597,19 +624,33 @@ def subresonances(rgr):
         # (Note that we are only testing the bonds with available pi electrons,
         # so this is compatible with having hypervalent atoms elsewhere in the
         # molecule)
-        bnd_ord_inc_ranges = [range(bnd_cap+1) for bnd_cap in bnd_caps]
-        for bnd_ord_incs in itertools.product(*bnd_ord_inc_ranges):
-            bnd_ord_inc_dct = dict(zip(bnd_keys, bnd_ord_incs))
-            ret_rgr = _add_pi_bonds(rgr, bnd_ord_inc_dct)
-
-            max_bnd_ord = max(bond_orders(ret_rgr).values())
-
-            atm_unsat_vlcs = dict_.values_by_key(
-                atom_unsaturated_valences(ret_rgr), atm_keys)
-
-            if not any(atm_unsat_vlc < 0 for atm_unsat_vlc in atm_unsat_vlcs):
-                if max_bnd_ord < 4:
-                    ret_rgrs.append(ret_rgr)
+        # The increments are assigned one bond at a time, so that a partial
+        # assignment exceeding a valence is cut off along with all of its
+        # completions. Combinations come out in the same order as they would
+        # from itertools.product.
+        def _bond_order_increments(idx):
+            if idx == len(bnd_keys):
+                yield ()
+                return
+
+            bnd_key = bnd_keys[idx]
+            for bnd_ord_inc in range(bnd_caps[idx]+1):
+                if (bnd_ord_dct[bnd_key] + bnd_ord_inc > 3 or
+                        any(atm_unsat_vlc_dct[k] < bnd_ord_inc
+                            for k in bnd_key)):
+                    break
+
+                for atm_key in bnd_key:
+                    atm_unsat_vlc_dct[atm_key] -= bnd_ord_inc
+                for bnd_ord_incs in _bond_order_increments(idx+1):
+                    yield (bnd_ord_inc,) + bnd_ord_incs
+                for atm_key in bnd_key:
+                    atm_unsat_vlc_dct[atm_key] += bnd_ord_inc
+
+        if max(bnd_ord_dct.values()) < 4:
+            for bnd_ord_incs in _bond_order_increments(0):
+                bnd_ord_inc_dct = dict(zip(bnd_keys, bnd_ord_incs))
+                ret_rgrs.append(_add_pi_bonds(rgr, bnd_ord_inc_dct))
 
     if not ret_rgrs:
         ret_rgrs = (rgr,)
@@ -725,10 +766,11 @@ def atom_lone_pair_counts(gra):
     """ lone pair counts, by atom
     """
     atm_symb_dct = atom_symbols(gra)
-    atm_group_idx_dct = dict_.transform_values(atm_symb_dct, ptab.to_group)
-    atm_lpc_dct = dict_.transform_values(atm_group_idx_dct,
-                                         LONE_PAIR_COUNTS_DCT.__getitem__)
-    atm_lpc_dct = dict_.transform_values(atm_lpc_dct, int)
+    # look each element up once, rather than once per atom
+    symb_lpc_dct = {symb: int(LONE_PAIR_COUNTS_DCT[ptab.to_group(symb)])
+                    for symb in set(atm_symb_dct.values())}
+    atm_lpc_dct = dict_.transform_values(atm_symb_dct,
+                                         symb_lpc_dct.__getitem__)
     return atm_lpc_dct
 
 
@@ -740,7 +782,8 @@ def atom_stereo_sorted_neighbor_atom_keys(gra, atm_key, atm_ngb_keys):
     # explicitly create an object array because otherwise the argsort
     # interprets [()] as []
     atm_pri_vecs = numpy.empty(len(atm_ngb_keys), dtype=numpy.object_)
-    atm_pri_vecs[:] = [stereo_priority_vector(gra, atm_key, atm_ngb_key)
+    _priority_vector = _stereo_priority_vector_function(gra)
+    atm_pri_vecs[:] = [_priority_vector(atm_key, atm_ngb_key)
                        for atm_ngb_key in atm_ngb_keys]
 
     sort_idxs = numpy.argsort(atm_pri_vecs)
@@ -752,51 +795,64 @@ def stereo_priority_vector(gra, atm_key, atm_ngb_key):
     """ generates a sortable one-to-one representation of the branch extending
     from `atm_key` through its bonded neighbor `atm_ngb_key`
     """
-    bbn_keys = backbone_keys(gra)
-    exp_hyd_keys = explicit_hydrogen_keys(gra)
-
-    if atm_ngb_key not in bbn_keys:
-        assert atm_ngb_key in exp_hyd_keys
-        assert frozenset({atm_key, atm_ngb_key}) in bonds(gra)
-        pri_vec = ()
-    else:
-        gra = implicit(gra)
-        atm_dct = atoms(gra)
-        bnd_dct = bonds(gra)
-        assert atm_key in bbn_keys
-        assert frozenset({atm_key, atm_ngb_key}) in bnd_dct
+    return _stereo_priority_vector_function(gra)(atm_key, atm_ngb_key)
 
-        # here, switch to an implicit graph
-        atm_ngb_keys_dct = atoms_neighbor_atom_keys(gra)
 
-        def _priority_vector(atm1_key, atm2_key, seen_keys):
-            # we keep a list of seen keys to cut off cycles, avoiding infinite
-            # loops
+def _stereo_priority_vector_function(gra):
+    """ a function generating stereo priority vectors for this graph
 
-            bnd_val = bnd_dct[frozenset({atm1_key, atm2_key})]
-            atm_val = atm_dct[atm2_key]
+    the parts of the calculation that only depend on the graph are done once
+    up front, so that the returned function can be called for many branches
+    """
+    bbn_keys = backbone_keys(gra)
+    exp_hyd_keys = explicit_hydrogen_keys(gra)
+    exp_bnd_keys = bond_keys(gra)
+
+    # here, switch to an implicit graph
+    imp_gra = implicit(gra)
+    bnd_keys = bond_keys(imp_gra)
+    atm_ngb_keys_dct = atoms_neighbor_atom_keys(imp_gra)
+    atm_val_dct = dict_.transform_values(
+        atoms(imp_gra), _replace_nones_with_negative_infinity)
+    bnd_val_dct = dict_.transform_values(
+        bonds(imp_gra), _replace_nones_with_negative_infinity)
+
+    def _priority_vector(atm1_key, atm2_key, seen_keys):
+        # we keep a list of seen keys to cut off cycles, avoiding infinite
+        # loops
+
+        bnd_val = bnd_val_dct[frozenset({atm1_key, atm2_key})]
+        atm_val = atm_val_dct[atm2_key]
+
+        if atm2_key in seen_keys:
+            ret = (bnd_val,)
+        else:
+            seen_keys.update({atm1_key, atm2_key})
+            atm3_keys = atm_ngb_keys_dct[atm2_key] - {atm1_key}
+            if atm3_keys:
+                next_vals, seen_keys = zip(*[
+                    _priority_vector(atm2_key, atm3_key, seen_keys)
+                    for atm3_key in atm3_keys])
+                ret = (bnd_val, atm_val) + next_vals
+            else:
+                ret = (bnd_val, atm_val)
 
-            bnd_val = _replace_nones_with_negative_infinity(bnd_val)
-            atm_val = _replace_nones_with_negative_infinity(atm_val)
+        return ret, seen_keys
 
-            if atm2_key in seen_keys:
-                ret = (bnd_val,)
-            else:
-                seen_keys.update({atm1_key, atm2_key})
-                atm3_keys = atm_ngb_keys_dct[atm2_key] - {atm1_key}
-                if atm3_keys:
-                    next_vals, seen_keys = zip(*[
-                        _priority_vector(atm2_key, atm3_key, seen_keys)
-                        for atm3_key in atm3_keys])
-                    ret = (bnd_val, atm_val) + next_vals
-                else:
-                    ret = (bnd_val, atm_val)
+    def _stereo_priority_vector(atm_key, atm_ngb_key):
+        if atm_ngb_key not in bbn_keys:
+            assert atm_ngb_key in exp_hyd_keys
+            assert frozenset({atm_key, atm_ngb_key}) in exp_bnd_keys
+            pri_vec = ()
+        else:
+            assert atm_key in bbn_keys
+            assert frozenset({atm_key, atm_ngb_key}) in bnd_keys
 
-            return ret, seen_keys
+            pri_vec, _ = _priority_vector(atm_key, atm_ngb_key, set())
 
-        pri_vec, _ = _priority_vector(atm_key, atm_ngb_key, set())
+        return pri_vec
 
-    return pri_vec
+    return _stereo_priority_vector
 
 
 def _replace_nones_with_negative_infinity(seq):
@@ -879,8 +935,8 @@ def atoms_sorted_neighbor_atom_keys(gra, symbs_first=('C',), symbs_last=('H',),
     atm_symb_dct = atom_symbols(gra)
     bnd_ord_dct = bond_orders(gra)
 
-    def _neighbor_keys(atm_key, atm_nbh):
-        keys = sorted(atom_keys(atm_nbh) - {atm_key})
+    def _neighbor_keys(atm_key, atm_ngb_keys):
+        keys = sorted(atm_ngb_keys)
         bnd_keys = [frozenset({atm_key, k}) for k in keys]
         ords = list(map(bnd_ord_dct.__getitem__, bnd_keys))
         ords = [-1 if o not in ords_last else ords_last.index(o)
@@ -894,7 +950,7 @@ def atoms_sorted_neighbor_atom_keys(gra, symbs_first=('C',), symbs_last=('H',),
         return keys
 
     atm_ngb_keys_dct = dict_.transform_items_to_values(
-        atom_neighborhoods(gra), _neighbor_keys)
+        atoms_neighbor_atom_keys(gra), _neighbor_keys)
     return atm_ngb_keys_dct
 
 
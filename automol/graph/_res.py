@@ -98,19 +98,21 @@ def _cumulene_chains(rgr):
     atm_ngb_keys_dct = atoms_neighbor_atom_keys(rgr)
 
     def _cumulene_chain(chain):
-        ret = None
-        atm_key = chain[-1]
-        next_atm_keys = atm_ngb_keys_dct[atm_key] - {chain[-2]}
-        if next_atm_keys:
+        # follow the sp1 atoms until the chain either ends in an sp2 atom or
+        # runs out
+        while True:
+            next_atm_keys = atm_ngb_keys_dct[chain[-1]] - {chain[-2]}
+            if not next_atm_keys:
+                return None
+
             assert len(next_atm_keys) == 1
             next_atm_key, = next_atm_keys
-            if next_atm_key in sp1_atm_keys:
-                chain.append(next_atm_key)
-                ret = _cumulene_chain(chain)
-            elif next_atm_key in sp2_atm_keys:
+            if next_atm_key in sp2_atm_keys:
                 chain.append(next_atm_key)
-                ret = chain
-        return ret
+                return chain
+            if next_atm_key not in sp1_atm_keys:
+                return None
+            chain.append(next_atm_key)
 
     cum_chains = []
     for atm_key in sp2_atm_keys:
@@ -118,7 +120,9 @@ def _cumulene_chains(rgr):
         chains = [[atm_key, atm_ngb_key] for atm_ngb_key in sp1_atm_ngb_keys]
         for chain in chains:
             cum_chain = _cumulene_chain(chain)
-            if cum_chain is not None:
+            # each chain is found once from either end, so only keep it from
+            # the end with the lower key
+            if cum_chain is not None and cum_chain[0] <= cum_chain[-1]:
                 cum_chains.append(cum_chain)
 
     cum_chains = tuple(map(tuple, cum_chains))
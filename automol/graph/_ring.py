@@ -45,17 +45,17 @@ def cycle_ring_atom_key_to_front(keys, key, end_key=None):
     :param end_key: optionally, ensure that another key is the last key in the
         ring; note that this is only possible if key and end_key are adjacent
     """
+    keys = tuple(keys)
     assert key in keys, ("{:d} is not in {:s}".format(key, str(keys)))
-    keys = tuple(itertools.islice(
-        itertools.dropwhile(lambda x: x != key, itertools.cycle(keys)),
-        len(keys)))
+    idx = keys.index(key)
+    keys = keys[idx:] + keys[:idx]
 
     if end_key is not None and keys[-1] != end_key:
         assert keys[1] == end_key, (
             "end_key {:d} is not adjacent to {:d} in the ring"
             .format(key, end_key))
-        keys = list(reversed(keys))
-        keys = cycle_ring_atom_key_to_front(keys, key)
+        # Reverse the ring, keeping the key in front
+        keys = keys[:1] + keys[:0:-1]
 
     return keys
 
@@ -18,7 +18,7 @@ from automol.graph._graph_dep import string
 from automol.graph._graph_dep import has_stereo
 from automol.graph._graph_dep import atom_stereo_keys
 from automol.graph._graph_dep import bond_stereo_keys
-from automol.graph._graph_dep import stereo_priority_vector
+from automol.graph._graph_dep import _stereo_priority_vector_function
 from automol.graph._graph_dep import explicit
 from automol.graph._graph_dep import sp2_bond_keys
 from automol.graph._graph import frozen
@@ -44,10 +44,11 @@ def stereogenic_atom_keys(gra, assigned=False):
         atm_keys -= atom_stereo_keys(gra)
 
     atm_ngb_keys_dct = atoms_neighbor_atom_keys(gra)
+    _priority_vector = _stereo_priority_vector_function(gra)
 
     def _is_stereogenic(atm_key):
         atm_ngb_keys = list(atm_ngb_keys_dct[atm_key])
-        pri_vecs = [stereo_priority_vector(gra, atm_key, atm_ngb_key)
+        pri_vecs = [_priority_vector(atm_key, atm_ngb_key)
                     for atm_ngb_key in atm_ngb_keys]
         ret = not any(pv1 == pv2
                       for pv1, pv2 in itertools.combinations(pri_vecs, r=2))
@@ -84,6 +85,7 @@ def stereogenic_bond_keys(gra, assigned=False):
         filter(lambda x: len(x) < 8, rings_bond_keys(gra)), frozenset())
 
     atm_ngb_keys_dct = atoms_neighbor_atom_keys(gra)
+    _priority_vector = _stereo_priority_vector_function(gra)
 
     def _is_stereogenic(bnd_key):
         atm1_key, atm2_key = bnd_key
@@ -97,8 +99,8 @@ def stereogenic_bond_keys(gra, assigned=False):
                 ret = False
             else:
                 assert len(atm_ngb_keys) == 2   # C=C(-X)-Y
-                ret = (stereo_priority_vector(gra, atm_key, atm_ngb_keys[0]) ==
-                       stereo_priority_vector(gra, atm_key, atm_ngb_keys[1]))
+                ret = (_priority_vector(atm_key, atm_ngb_keys[0]) ==
+                       _priority_vector(atm_key, atm_ngb_keys[1]))
 
             return ret
 
@@ -168,12 +170,24 @@ def substereomers(gra):
 def atom_stereo_sorted_neighbor_atom_keys(gra, atm_key, atm_ngb_keys):
     """ get the neighbor keys of an atom sorted by stereo priority
     """
+    _priority_vector = _stereo_priority_vector_function(gra)
+    return _stereo_sorted_neighbor_atom_keys(
+        _priority_vector, atm_key, atm_ngb_keys)
+
+
+def _stereo_sorted_neighbor_atom_keys(pri_vec_func, atm_key, atm_ngb_keys):
+    """ sort neighbor keys by stereo priority, given a function to generate
+    the priority vectors (see `_stereo_priority_vector_function`)
+
+    sharing the function avoids redoing its setup for every stereo atom in the
+    same graph
+    """
     atm_ngb_keys = list(atm_ngb_keys)
 
     # explicitly create an object array because otherwise the argsort
     # interprets [()] as []
     atm_pri_vecs = numpy.empty(len(atm_ngb_keys), dtype=numpy.object_)
-    atm_pri_vecs[:] = [stereo_priority_vector(gra, atm_key, atm_ngb_key)
+    atm_pri_vecs[:] = [pri_vec_func(atm_key, atm_ngb_key)
                        for atm_ngb_key in atm_ngb_keys]
 
     sort_idxs = numpy.argsort(atm_pri_vecs)
@@ -196,13 +210,14 @@ def atoms_stereo_sorted_neighbor_atom_keys(sgr):
     atm_ste_keys = atom_stereo_keys(sgr)
     bnd_ste_keys = bond_stereo_keys(sgr)
     atm_ngb_keys_dct = atoms_neighbor_atom_keys(sgr)
+    _priority_vector = _stereo_priority_vector_function(sgr)
 
     ste_atm_ngb_keys_dct = {}
     for atm_key in atm_ste_keys:
         atm_ngb_keys = atm_ngb_keys_dct[atm_key]
 
-        ste_atm_ngb_keys_dct[atm_key] = atom_stereo_sorted_neighbor_atom_keys(
-            sgr, atm_key, atm_ngb_keys)
+        ste_atm_ngb_keys_dct[atm_key] = _stereo_sorted_neighbor_atom_keys(
+            _priority_vector, atm_key, atm_ngb_keys)
 
     for bnd_key in bnd_ste_keys:
         atm1_key, atm2_key = sorted(bnd_key)
@@ -210,10 +225,10 @@ def atoms_stereo_sorted_neighbor_atom_keys(sgr):
         atm1_ngb_keys = atm_ngb_keys_dct[atm1_key] - bnd_key
         atm2_ngb_keys = atm_ngb_keys_dct[atm2_key] - bnd_key
 
-        ste_atm_ngb_keys_dct[atm1_key] = atom_stereo_sorted_neighbor_atom_keys(
-            sgr, atm1_key, atm1_ngb_keys)
-        ste_atm_ngb_keys_dct[atm2_key] = atom_stereo_sorted_neighbor_atom_keys(
-            sgr, atm2_key, atm2_ngb_keys)
+        ste_atm_ngb_keys_dct[atm1_key] = _stereo_sorted_neighbor_atom_keys(
+            _priority_vector, atm1_key, atm1_ngb_keys)
+        ste_atm_ngb_keys_dct[atm2_key] = _stereo_sorted_neighbor_atom_keys(
+            _priority_vector, atm2_key, atm2_ngb_keys)
 
     return ste_atm_ngb_keys_dct
 
@@ -305,10 +320,12 @@ def from_index_based_stereo(sgr):
             atm_keys.update(stereogenic_atom_keys(gra) & atm_keys_pool)
             bnd_keys.update(stereogenic_bond_keys(gra) & bnd_keys_pool)
 
+            _priority_vector = _stereo_priority_vector_function(gra)
+
             # Determine absolute stereo assignments for atoms
             for atm_key in atm_keys:
-                abs_srt_keys = atom_stereo_sorted_neighbor_atom_keys(
-                    gra, atm_key, atm_ngb_keys_dct[atm_key])
+                abs_srt_keys = _stereo_sorted_neighbor_atom_keys(
+                    _priority_vector, atm_key, atm_ngb_keys_dct[atm_key])
                 idx_srt_keys = sorted(abs_srt_keys)
 
                 if automol.util.is_even_permutation(idx_srt_keys,
@@ -323,10 +340,12 @@ def from_index_based_stereo(sgr):
             for bnd_key in bnd_keys:
                 atm1_key, atm2_key = sorted(bnd_key)
 
-                atm1_abs_srt_keys = atom_stereo_sorted_neighbor_atom_keys(
-                    gra, atm1_key, atm_ngb_keys_dct[atm1_key] - bnd_key)
-                atm2_abs_srt_keys = atom_stereo_sorted_neighbor_atom_keys(
-                    gra, atm2_key, atm_ngb_keys_dct[atm2_key] - bnd_key)
+                atm1_abs_srt_keys = _stereo_sorted_neighbor_atom_keys(
+                    _priority_vector, atm1_key,
+                    atm_ngb_keys_dct[atm1_key] - bnd_key)
+                atm2_abs_srt_keys = _stereo_sorted_neighbor_atom_keys(
+                    _priority_vector, atm2_key,
+                    atm_ngb_keys_dct[atm2_key] - bnd_key)
                 atm1_idx_srt_keys = sorted(atm1_abs_srt_keys)
                 atm2_idx_srt_keys = sorted(atm2_abs_srt_keys)
 
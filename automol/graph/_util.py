@@ -1,6 +1,31 @@
 """
   Various helper functions for dealing with graphs
 """
+import automol.create as _create
+from automol.graph._graph_dep import atoms
+from automol.graph._graph_dep import bonds
+
+
+# Hashable forms of graphs, for caching
+def freeze(gra):
+    """ a hashable form of a graph, preserving its atom and bond order
+
+    :param gra: the graph
+    :returns: the atom and bond items of the graph, as tuples
+    """
+    return (tuple(atoms(gra).items()), tuple(bonds(gra).items()))
+
+
+def thaw(frz_gra):
+    """ a graph from the hashable form returned by `freeze`
+
+    Each call builds a new graph, so the result can be changed without
+    affecting any cached values.
+
+    :param frz_gra: the hashable form of the graph
+    :returns: the graph
+    """
+    return _create.graph.from_atoms_and_bonds(*map(dict, frz_gra))
 
 
 # Handle the formatting of various lists
@@ -20,7 +20,7 @@ def coordinates(geo, idxs=None, angstrom=False):
         :rtype: tuple(tuple(float))
     """
 
-    idxs = list(range(count(geo))) if idxs is None else idxs
+    idxs = set(range(count(geo))) if idxs is None else set(idxs)
     if geo:
         # print(geo)
         # print(*geo)
@@ -136,7 +136,7 @@ def symbols(geo, idxs=None):
         :rtype: tuple(str)
     """
 
-    idxs = list(range(count(geo))) if idxs is None else idxs
+    idxs = set(range(count(geo))) if idxs is None else set(idxs)
 
     if geo:
         symbs, _ = zip(*geo)
@@ -5,6 +5,7 @@ Breaking bonds are encoded as 0.9-order bonds
 
 Otherwise, this is equivalent to any other graph
 """
+import functools
 from automol.util import dict_
 from automol.graph._graph_dep import atom_stereo_parities
 from automol.graph._graph_dep import bond_stereo_parities
@@ -18,6 +19,8 @@ from automol.graph._graph_dep import atom_stereo_keys
 from automol.graph._graph_dep import bond_stereo_keys
 from automol.graph._embed_dep import rings_bond_keys
 from automol.graph._embed_dep import sorted_ring_atom_keys_from_bond_keys
+from automol.graph._util import freeze
+from automol.graph._util import thaw
 from automol.graph._stereo import stereomers as _stereomers
 from automol.graph._stereo import stereogenic_atom_keys
 from automol.graph._stereo import stereogenic_bond_keys
@@ -41,20 +44,32 @@ def graph(gra, frm_bnd_keys, brk_bnd_keys):
     return tsg
 
 
-def forming_bond_keys(tsg):
-    """ get the forming bonds from a transition state graph
+def forming_and_breaking_bond_keys(tsg):
+    """ get the forming and breaking bonds from a transition state graph, in
+    a single pass over its bond orders
+
+    :returns: the forming bond keys and the breaking bond keys
+    :rtype: (frozenset[frozenset[int]], frozenset[frozenset[int]])
     """
     ord_dct = bond_orders(tsg)
     frm_bnd_keys = [k for k, o in ord_dct.items() if round(o, 1) == 0.1]
-    return frozenset(map(frozenset, frm_bnd_keys))
+    brk_bnd_keys = [k for k, o in ord_dct.items() if round(o, 1) == 0.9]
+    return (frozenset(map(frozenset, frm_bnd_keys)),
+            frozenset(map(frozenset, brk_bnd_keys)))
+
+
+def forming_bond_keys(tsg):
+    """ get the forming bonds from a transition state graph
+    """
+    frm_bnd_keys, _ = forming_and_breaking_bond_keys(tsg)
+    return frm_bnd_keys
 
 
 def breaking_bond_keys(tsg):
     """ get the forming bonds from a transition state graph
     """
-    ord_dct = bond_orders(tsg)
-    brk_bnd_keys = [k for k, o in ord_dct.items() if round(o, 1) == 0.9]
-    return frozenset(map(frozenset, brk_bnd_keys))
+    _, brk_bnd_keys = forming_and_breaking_bond_keys(tsg)
+    return brk_bnd_keys
 
 
 def reverse(tsg, dummies=True):
@@ -63,9 +78,10 @@ def reverse(tsg, dummies=True):
     if not dummies:
         tsg = without_dummy_atoms(tsg)
 
+    frm_bnd_keys, brk_bnd_keys = forming_and_breaking_bond_keys(tsg)
     return graph(gra=tsg,
-                 frm_bnd_keys=breaking_bond_keys(tsg),
-                 brk_bnd_keys=forming_bond_keys(tsg))
+                 frm_bnd_keys=brk_bnd_keys,
+                 brk_bnd_keys=frm_bnd_keys)
 
 
 def forming_rings_atom_keys(tsg):
@@ -135,12 +151,7 @@ def nonconserved_atom_stereo_keys(ste_tsg, check=True):
     prds_gra = products_graph(ste_tsg)
 
     if check:
-        ste_atm_keys = stereogenic_atom_keys(rcts_gra)
-        ste_bnd_keys = stereogenic_bond_keys(rcts_gra)
-        assert not ste_atm_keys, (
-            "Unassigned atom stereo centers: {}".format(str(ste_atm_keys)))
-        assert not ste_bnd_keys, (
-            "Unassigned bond stereo centers: {}".format(str(ste_bnd_keys)))
+        _assert_fully_assigned(rcts_gra)
 
     keys1 = atom_stereo_keys(rcts_gra)
     keys2 = stereogenic_atom_keys(prds_gra, assigned=True)
@@ -166,12 +177,7 @@ def nonconserved_bond_stereo_keys(ste_tsg, check=True):
     prds_gra = products_graph(ste_tsg)
 
     if check:
-        ste_atm_keys = stereogenic_atom_keys(rcts_gra)
-        ste_bnd_keys = stereogenic_bond_keys(rcts_gra)
-        assert not ste_atm_keys, (
-            "Unassigned atom stereo centers: {}".format(str(ste_atm_keys)))
-        assert not ste_bnd_keys, (
-            "Unassigned bond stereo centers: {}".format(str(ste_bnd_keys)))
+        _assert_fully_assigned(rcts_gra)
 
     keys1 = bond_stereo_keys(rcts_gra)
     keys2 = stereogenic_bond_keys(prds_gra, assigned=True)
@@ -182,6 +188,19 @@ def nonconserved_bond_stereo_keys(ste_tsg, check=True):
     return cre_ste_bnd_keys, des_ste_bnd_keys
 
 
+def _assert_fully_assigned(gra):
+    """ Assert that a graph has no unassigned stereo centers.
+
+    :param gra: the graph
+    """
+    ste_atm_keys = stereogenic_atom_keys(gra)
+    ste_bnd_keys = stereogenic_bond_keys(gra)
+    assert not ste_atm_keys, (
+        "Unassigned atom stereo centers: {}".format(str(ste_atm_keys)))
+    assert not ste_bnd_keys, (
+        "Unassigned bond stereo centers: {}".format(str(ste_bnd_keys)))
+
+
 def to_index_based_stereo(ste_tsg):
     """ Convert a TS graph to index-based stereo assignments, where parities
     are defined relative to the ordering of indices rather than the absolute
@@ -191,8 +210,7 @@ def to_index_based_stereo(ste_tsg):
     :returns: a TS graph with index-based stereo assignments
     """
     rcts_gra = reactants_graph(ste_tsg)
-    frm_bnd_keys = forming_bond_keys(ste_tsg)
-    brk_bnd_keys = breaking_bond_keys(ste_tsg)
+    frm_bnd_keys, brk_bnd_keys = forming_and_breaking_bond_keys(ste_tsg)
 
     rcts_gra = _to_index_based_stereo(rcts_gra)
     idx_tsg = graph(rcts_gra, frm_bnd_keys, brk_bnd_keys)
@@ -207,8 +225,7 @@ def from_index_based_stereo(idx_tsg):
     :returns: a TS graph with absolute stereo assignments
     """
     rcts_gra = reactants_graph(idx_tsg)
-    frm_bnd_keys = forming_bond_keys(idx_tsg)
-    brk_bnd_keys = breaking_bond_keys(idx_tsg)
+    frm_bnd_keys, brk_bnd_keys = forming_and_breaking_bond_keys(idx_tsg)
 
     rcts_gra = _from_index_based_stereo(rcts_gra)
     ste_tsg = graph(rcts_gra, frm_bnd_keys, brk_bnd_keys)
@@ -223,8 +240,7 @@ def stereomers(tsg):
     :returns: All possible TS graphs with stereo assignments for the reactants.
     """
     rcts_gra = reactants_graph(tsg)
-    frm_bnd_keys = forming_bond_keys(tsg)
-    brk_bnd_keys = breaking_bond_keys(tsg)
+    frm_bnd_keys, brk_bnd_keys = forming_and_breaking_bond_keys(tsg)
 
     rcts_gra = without_stereo_parities(rcts_gra)
     rcts_sgrs = _stereomers(rcts_gra)
@@ -240,10 +256,10 @@ def compatible_reverse_stereomers(ste_tsg):
     :param ste_tsg: The TS graph, with stereo assignments.
     :returns: All possible reverse TS graphs.
     """
-    frm_bnd_keys = forming_bond_keys(ste_tsg)
-    brk_bnd_keys = breaking_bond_keys(ste_tsg)
+    frm_bnd_keys, brk_bnd_keys = forming_and_breaking_bond_keys(ste_tsg)
+    # the reactants only need to be checked for unassigned stereo once
     _, des_ste_atm_keys = nonconserved_atom_stereo_keys(ste_tsg)
-    _, des_ste_bnd_keys = nonconserved_bond_stereo_keys(ste_tsg)
+    _, des_ste_bnd_keys = nonconserved_bond_stereo_keys(ste_tsg, check=False)
     cons_atm_keys = sorted(atom_stereo_keys(ste_tsg) - des_ste_atm_keys)
     cons_bnd_keys = sorted(bond_stereo_keys(ste_tsg) - des_ste_bnd_keys)
 
@@ -257,8 +273,7 @@ def compatible_reverse_stereomers(ste_tsg):
     # 2. Determine all possible index-based stereo assignments for the reverse
     #    reaction.
     prds_gra = without_stereo_parities(products_graph(ste_tsg))
-    prds_sgrs = _stereomers(prds_gra)
-    prds_idx_sgrs = list(map(_to_index_based_stereo, prds_sgrs))
+    prds_idx_sgrs = map(thaw, _index_based_stereomers(freeze(prds_gra)))
     rev_idx_tsgs_pool = [
         graph(p, brk_bnd_keys, frm_bnd_keys) for p in prds_idx_sgrs]
 
@@ -278,3 +293,20 @@ def compatible_reverse_stereomers(ste_tsg):
     #    assignments to absolute stereo assignments.
     rev_ste_tsgs = list(map(from_index_based_stereo, rev_idx_tsgs))
     return rev_ste_tsgs
+
+
+@functools.lru_cache(maxsize=64)
+def _index_based_stereomers(frz_gra):
+    """ All stereomers of a graph in hashable form, with index-based stereo
+    assignments.
+
+    The result is cached, since the reverse stereomers for every stereomer of
+    a TS graph are expanded from the same stereo-free products graph. The
+    stereomers are cached in hashable form as well, so callers must `thaw`
+    them and can't change the cached values.
+
+    :param frz_gra: a hashable form of the graph, without stereo
+    :returns: the index-based stereomers, in hashable form
+    """
+    gra = thaw(frz_gra)
+    return tuple(freeze(_to_index_based_stereo(s)) for s in _stereomers(gra))
@@ -518,11 +518,8 @@ def _atoms_missing_neighbors(gra, zma_keys):
     are not in the v-matrix
     """
     ngb_keys_dct = atoms_neighbor_atom_keys(gra)
-    keys = []
-    for key in zma_keys:
-        if any(k not in zma_keys for k in ngb_keys_dct[key]):
-            keys.append(key)
-    keys = tuple(keys)
+    zma_key_set = set(zma_keys)
+    keys = tuple(k for k in zma_keys if not ngb_keys_dct[k] <= zma_key_set)
     return keys
 
 
@@ -81,8 +81,8 @@ def ring_forming_scission_ts_geometry(rxn, rct_geos,
     """
     assert rxn.class_ == par.ReactionClass.RING_FORM_SCISSION
     assert rxn.has_standard_keys()
-    frm_bnd_key, = ts.forming_bond_keys(rxn.forward_ts_graph)
-    brk_bnd_key, = ts.breaking_bond_keys(rxn.forward_ts_graph)
+    (frm_bnd_key,), (brk_bnd_key,) = ts.forming_and_breaking_bond_keys(
+        rxn.forward_ts_graph)
     frm_bnd_dist = 2.0
     brk_bnd_dist = 1.5
     d1234 = 180.
@@ -353,6 +353,20 @@ def substitution_ts_geometry(rxn, rct_geos,
     return geo
 
 
+_TS_GEOMETRY_FNS = {
+    # unimolecular
+    par.ReactionClass.HYDROGEN_MIGRATION: hydrogen_migration_ts_geometry,
+    par.ReactionClass.BETA_SCISSION: beta_scission_ts_geometry,
+    par.ReactionClass.RING_FORM_SCISSION: ring_forming_scission_ts_geometry,
+    par.ReactionClass.ELIMINATION: elimination_ts_geometry,
+    # bimolecular
+    par.ReactionClass.HYDROGEN_ABSTRACTION: hydrogen_abstraction_ts_geometry,
+    par.ReactionClass.ADDITION: addition_ts_geometry,
+    par.ReactionClass.INSERTION: insertion_ts_geometry,
+    par.ReactionClass.SUBSTITUTION: substitution_ts_geometry,
+}
+
+
 def ts_geometry(rxn, rct_geos, max_dist_err=2e-1, log=False):
     """ reaction-class-specific embedding info
 
@@ -360,22 +374,7 @@ def ts_geometry(rxn, rct_geos, max_dist_err=2e-1, log=False):
     :param rct_geos: the reactant geometries
     :returns: the TS geometry
     """
-    function_dct = {
-        # unimolecular
-        par.ReactionClass.HYDROGEN_MIGRATION: hydrogen_migration_ts_geometry,
-        par.ReactionClass.BETA_SCISSION: beta_scission_ts_geometry,
-        par.ReactionClass.RING_FORM_SCISSION:
-        ring_forming_scission_ts_geometry,
-        par.ReactionClass.ELIMINATION: elimination_ts_geometry,
-        # bimolecular
-        par.ReactionClass.HYDROGEN_ABSTRACTION:
-        hydrogen_abstraction_ts_geometry,
-        par.ReactionClass.ADDITION: addition_ts_geometry,
-        par.ReactionClass.INSERTION: insertion_ts_geometry,
-        par.ReactionClass.SUBSTITUTION: substitution_ts_geometry,
-    }
-
-    fun_ = function_dct[rxn.class_]
+    fun_ = _TS_GEOMETRY_FNS[rxn.class_]
     geo = fun_(rxn, rct_geos, max_dist_err=max_dist_err, log=log)
     return geo
 
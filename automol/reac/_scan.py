@@ -2,8 +2,8 @@
 """
 
 import math
+import functools
 import numpy
-import more_itertools as mit
 from phydat import phycon, bnd
 from automol.graph import ts
 from automol.par import ReactionClass
@@ -14,6 +14,17 @@ from automol.reac._util import ring_forming_scission_chain
 from automol.reac._util import insertion_forming_bond_keys
 
 
+# Bond-length offsets used by the grid builders, converted to bohr once
+_DR_005 = 0.05 * phycon.ANG2BOHR
+_DR_01 = 0.1 * phycon.ANG2BOHR
+_DR_02 = 0.2 * phycon.ANG2BOHR
+_DR_07 = 0.7 * phycon.ANG2BOHR
+_DR_08 = 0.8 * phycon.ANG2BOHR
+_DR_10 = 1.0 * phycon.ANG2BOHR
+_DR_12 = 1.2 * phycon.ANG2BOHR
+_DR_14 = 1.4 * phycon.ANG2BOHR
+
+
 # Wrapper function to obtain all of the scan data for a reaction
 def build_scan_info(zrxn, zma):
     """ Build all of the scan information
@@ -95,8 +106,9 @@ def ring_forming_scission_constraint_coordinates(rxn, zma):
     :rtype: str
     """
     chain_keys = ring_forming_scission_chain(rxn)
-    ang_keys_lst = sorted(mit.windowed(chain_keys[1:], 3))
-    dih_keys_lst = sorted(mit.windowed(chain_keys, 4))
+    nwins = len(chain_keys) - 3
+    ang_keys_lst = sorted(chain_keys[i+1:i+4] for i in range(nwins))
+    dih_keys_lst = sorted(chain_keys[i:i+4] for i in range(nwins))
     ang_names = [automol.zmat.central_angle_coordinate_name(zma, *ks)
                  for ks in ang_keys_lst]
     dih_names = [automol.zmat.dihedral_angle_coordinate_name(zma, *ks)
@@ -171,28 +183,45 @@ def substitution_scan_coordinate(rxn, zma):
     return scan_name
 
 
+def _return_empty_tuple(*_):
+    return ()
+
+
+_SCAN_COORD_FNS = {
+    # unimolecular
+    ReactionClass.HYDROGEN_MIGRATION: hydrogen_migration_scan_coordinate,
+    ReactionClass.BETA_SCISSION: beta_scission_scan_coordinate,
+    ReactionClass.RING_FORM_SCISSION: ring_forming_scission_scan_coordinate,
+    ReactionClass.ELIMINATION: elimination_scan_coordinate,
+    # bimolecular
+    ReactionClass.HYDROGEN_ABSTRACTION: hydrogen_abstraction_scan_coordinate,
+    ReactionClass.ADDITION: addition_scan_coordinate,
+    ReactionClass.INSERTION: insertion_scan_coordinate,
+    ReactionClass.SUBSTITUTION: substitution_scan_coordinate,
+}
+
+_CONST_COORD_FNS = {
+    # unimolecular
+    ReactionClass.HYDROGEN_MIGRATION:
+    hydrogen_migration_constraint_coordinates,
+    ReactionClass.BETA_SCISSION: _return_empty_tuple,
+    ReactionClass.RING_FORM_SCISSION:
+    ring_forming_scission_constraint_coordinates,
+    ReactionClass.ELIMINATION: _return_empty_tuple,
+    # bimolecular
+    ReactionClass.HYDROGEN_ABSTRACTION: _return_empty_tuple,
+    ReactionClass.ADDITION: _return_empty_tuple,
+    ReactionClass.INSERTION: _return_empty_tuple,
+    ReactionClass.SUBSTITUTION: _return_empty_tuple,
+}
+
+
 def scan_coordinate(rxn, zma):
     """ Obtain the scan coordinates
 
     :param rxn: a hydrogen migration Reaction object
     """
-    function_dct = {
-        # unimolecular
-        ReactionClass.HYDROGEN_MIGRATION:
-        hydrogen_migration_scan_coordinate,
-        ReactionClass.BETA_SCISSION: beta_scission_scan_coordinate,
-        ReactionClass.RING_FORM_SCISSION:
-        ring_forming_scission_scan_coordinate,
-        ReactionClass.ELIMINATION: elimination_scan_coordinate,
-        # bimolecular
-        ReactionClass.HYDROGEN_ABSTRACTION:
-        hydrogen_abstraction_scan_coordinate,
-        ReactionClass.ADDITION: addition_scan_coordinate,
-        ReactionClass.INSERTION: insertion_scan_coordinate,
-        ReactionClass.SUBSTITUTION: substitution_scan_coordinate,
-    }
-
-    fun_ = function_dct[rxn.class_]
+    fun_ = _SCAN_COORD_FNS[rxn.class_]
     ret = fun_(rxn, zma)
     return ret
 
@@ -202,27 +231,7 @@ def constraint_coordinates(rxn, zma):
 
     :param rxn: a hydrogen migration Reaction object
     """
-
-    def _return_empty_tuple(*_):
-        return ()
-
-    function_dct = {
-        # unimolecular
-        ReactionClass.HYDROGEN_MIGRATION:
-        hydrogen_migration_constraint_coordinates,
-        ReactionClass.BETA_SCISSION: _return_empty_tuple,
-        ReactionClass.RING_FORM_SCISSION:
-        ring_forming_scission_constraint_coordinates,
-        ReactionClass.ELIMINATION: _return_empty_tuple,
-        # bimolecular
-        ReactionClass.HYDROGEN_ABSTRACTION:
-        _return_empty_tuple,
-        ReactionClass.ADDITION: _return_empty_tuple,
-        ReactionClass.INSERTION: _return_empty_tuple,
-        ReactionClass.SUBSTITUTION: _return_empty_tuple,
-    }
-
-    fun_ = function_dct[rxn.class_]
+    fun_ = _CONST_COORD_FNS[rxn.class_]
     ret = fun_(rxn, zma)
     return ret
 
@@ -241,20 +250,20 @@ def hydrogen_migration_grid(zrxn, zma, npoints=(18,)):
 
     frm_bnd_len = _ts_bnd_len(zma, scan_name)
     rmin1 = 2.0*phycon.ANG2BOHR
-    rmin2 = frm_bnd_len + 0.05 * phycon.ANG2BOHR
+    rmin2 = frm_bnd_len + _DR_005
     rmax = frm_bnd_len
 
     if rmax > rmin1:
         npoints = math.ceil((rmax-rmin1)/interval)
         if npoints < 1:
-            grid1 = []
+            grid1 = ()
         else:
-            grid1 = numpy.linspace(rmax, rmin1, npoints)
+            grid1 = _linspace_tuple(rmax, rmin1, npoints)
     else:
-        grid1 = []
+        grid1 = ()
 
-    grid2 = numpy.linspace(rmin1, rmin2, 18)
-    grid = numpy.concatenate((grid1, grid2), axis=None)
+    grid2 = _linspace_tuple(rmin1, rmin2, 18)
+    grid = grid1 + grid2
 
     return grid
 
@@ -271,12 +280,12 @@ def beta_scission_grid(zrxn, zma, npoints=(14,)):
 
     frm_bnd_len = _ts_bnd_len(zma, scan_name)
     if frm_bnd_len is not None:
-        rmin = frm_bnd_len + 0.1 * phycon.ANG2BOHR
-        rmax = frm_bnd_len + 0.8 * phycon.ANG2BOHR
+        rmin = frm_bnd_len + _DR_01
+        rmax = frm_bnd_len + _DR_08
     else:
         rmin = 1.4 * phycon.ANG2BOHR
         rmax = 2.0 * phycon.ANG2BOHR
-    grid = numpy.linspace(rmin, rmax, npoints1)
+    grid = _linspace_tuple(rmin, rmax, npoints1)
 
     return grid
 
@@ -295,14 +304,13 @@ def ring_forming_scission_grid(zrxn, zma, npoints=(7,)):
 
     brk_bnd_len = _ts_bnd_len(zma, scan_name)
     if brk_bnd_len is not None:
-        r1min = brk_bnd_len + 0.1 * phycon.ANG2BOHR
-        r1max = brk_bnd_len + 0.7 * phycon.ANG2BOHR
+        r1min = brk_bnd_len + _DR_01
+        r1max = brk_bnd_len + _DR_07
     else:
         r1min = (1.54 + 0.1) * phycon.ANG2BOHR
         r1max = (1.54 + 0.7) * phycon.ANG2BOHR
 
-    grid1 = numpy.linspace(r1min, r1max, npoints1)
-    grid = tuple(val.item() for val in grid1)
+    grid = _linspace_tuple(r1min, r1max, npoints1)
 
     return grid
 
@@ -321,20 +329,20 @@ def elimination_grid(zrxn, zma, npoints=(8, 4)):
     # brk_bnd_len = _ts_bnd_len(zrxn, zma, choice='brk')
     brk_bnd_len = None
     if frm_bnd_len is not None:
-        r1min = frm_bnd_len + 0.2
-        r1max = frm_bnd_len + 1.4
+        r1min = frm_bnd_len + _DR_02
+        r1max = frm_bnd_len + _DR_14
     else:
         r1min = (1.54 + 0.2) * phycon.ANG2BOHR
         r1max = (1.54 + 1.4) * phycon.ANG2BOHR
     if brk_bnd_len is not None:
-        r2min = brk_bnd_len + 0.2
-        r2max = brk_bnd_len + 0.8
+        r2min = brk_bnd_len + _DR_02
+        r2max = brk_bnd_len + _DR_08
     else:
         r2min = (0.74 + 0.2) * phycon.ANG2BOHR
         r2max = (0.74 + 0.8) * phycon.ANG2BOHR
 
-    grid1 = numpy.linspace(r1min, r1max, npoints1) * phycon.ANG2BOHR
-    grid2 = numpy.linspace(r2min, r2max, npoints2) * phycon.ANG2BOHR
+    grid1 = _linspace_tuple(r1min, r1max, npoints1)
+    grid2 = _linspace_tuple(r2min, r2max, npoints2)
     grid = (grid1, grid2)
 
     return grid
@@ -353,12 +361,12 @@ def hydrogen_abstraction_grid(zrxn, zma, npoints=(8,)):
 
     frm_bnd_len = _ts_bnd_len(zma, scan_name)
     if frm_bnd_len is not None:
-        rmin = frm_bnd_len + 0.1 * phycon.ANG2BOHR
-        rmax = frm_bnd_len + 1.0 * phycon.ANG2BOHR
+        rmin = frm_bnd_len + _DR_01
+        rmax = frm_bnd_len + _DR_10
     else:
         rmin = 0.7 * phycon.ANG2BOHR
         rmax = 2.2 * phycon.ANG2BOHR
-    grid = numpy.linspace(rmin, rmax, npoints1)
+    grid = _linspace_tuple(rmin, rmax, npoints1)
 
     return grid
 
@@ -375,14 +383,14 @@ def addition_grid(zrxn, zma, npoints=(14,)):
 
     frm_bnd_len = _ts_bnd_len(zma, scan_name)
     if frm_bnd_len is not None:
-        rmin = frm_bnd_len + 0.1 * phycon.ANG2BOHR
-        rmax = frm_bnd_len + 1.2 * phycon.ANG2BOHR
+        rmin = frm_bnd_len + _DR_01
+        rmax = frm_bnd_len + _DR_12
     else:
         rmin = 1.6 * phycon.ANG2BOHR
         rmax = 2.8 * phycon.ANG2BOHR
 
-    grid = _geometric_progression(
-        rmin, rmax, npoints1, gfact=1.1, rstp=0.05)
+    grid = tuple(_geometric_progression(
+        rmin, rmax, npoints1, gfact=1.1, rstp=0.05).tolist())
 
     return grid
 
@@ -400,12 +408,12 @@ def insertion_grid(zrxn, zma, npoints=(16,)):
     frm_bnd_len = _ts_bnd_len(zma, scan_name)
     if frm_bnd_len is not None:
         rmin = frm_bnd_len
-        rmax = frm_bnd_len + 1.4 * phycon.ANG2BOHR
+        rmax = frm_bnd_len + _DR_14
     else:
         rmin = 1.4 * phycon.ANG2BOHR
         rmax = 2.4 * phycon.ANG2BOHR
 
-    grid = numpy.linspace(rmin, rmax, npoints1)
+    grid = _linspace_tuple(rmin, rmax, npoints1)
 
     return grid
 
@@ -423,12 +431,12 @@ def substitution_grid(zrxn, zma, npoints=(14,)):
     frm_bnd_len = _ts_bnd_len(zma, scan_name)
     if frm_bnd_len is not None:
         rmin = frm_bnd_len
-        rmax = frm_bnd_len + 1.4 * phycon.ANG2BOHR
+        rmax = frm_bnd_len + _DR_14
     else:
         rmin = 0.7 * phycon.ANG2BOHR
         rmax = 2.4 * phycon.ANG2BOHR
 
-    grid = numpy.linspace(rmin, rmax, npoints1)
+    grid = _linspace_tuple(rmin, rmax, npoints1)
 
     return grid
 
@@ -448,11 +456,11 @@ def radrad_addition_grid(npoints=(5, 6)):
     rend1 = 1.8 * phycon.ANG2BOHR
     rend2 = 3.85 * phycon.ANG2BOHR
 
-    grid1 = numpy.linspace(rstart, rend1, npoints1)
-    grid2 = numpy.linspace(rstart, rend2, npoints2)
-    # grid2 = numpy.delete(grid2, 0)
-    grid = [grid1, grid2]
-    # grid = numpy.concatenate((grid1, grid2), axis=None)
+    grid1 = _linspace_tuple(rstart, rend1, npoints1)
+    grid2 = _linspace_tuple(rstart, rend2, npoints2)
+    # grid2 = grid2[1:]
+    grid = (grid1, grid2)
+    # grid = grid1 + grid2
 
     return grid
 
@@ -471,17 +479,21 @@ def radrad_hydrogen_abstraction_grid(npoints=(8, 4)):
     rend1 = 1.4 * phycon.ANG2BOHR
     rend2 = 3.0 * phycon.ANG2BOHR
 
-    grid1 = numpy.linspace(rstart, rend1, npoints1)
-    grid2 = numpy.linspace(rstart, rend2, npoints2)
-    grid2 = numpy.delete(grid2, 0)
-    # grid = numpy.concatenate((grid1, grid2), axis=None)
-    grid = [grid1, grid2]
+    grid1 = _linspace_tuple(rstart, rend1, npoints1)
+    grid2 = _linspace_tuple(rstart, rend2, npoints2)
+    grid2 = grid2[1:]
+    # grid = grid1 + grid2
+    grid = (grid1, grid2)
 
     return grid
 
 
+@functools.lru_cache(maxsize=1024)
 def _ts_bnd_len(zma, scan_coord):
     """ Obtain the current value of the bond defined by the scam coordinate
+
+    Results are cached; z-matrices are nested tuples, so they can be used
+    directly as cache keys.
     """
 
     symbs = automol.zmat.symbols(zma)
@@ -492,22 +504,68 @@ def _ts_bnd_len(zma, scan_coord):
     return ts_bnd_len
 
 
+def _unit_linspace(num):
+    """ Build a read-only, evenly spaced grid over [0, 1]
+    """
+    grid = numpy.linspace(0., 1., num)
+    grid.setflags(write=False)
+    return grid
+
+
+# Unit grids for the point counts used by the grid builders
+_UNIT_LINSPACES = {num: _unit_linspace(num)
+                   for num in (4, 5, 6, 7, 8, 14, 16, 18)}
+
+
+def _linspace_tuple(start, stop, num):
+    """ Build an evenly spaced grid as a tuple of floats
+
+    As with `numpy.linspace`, the last point is exactly `stop`.
+    """
+    unit_grid = _UNIT_LINSPACES.get(num)
+    if unit_grid is None:
+        grid = numpy.linspace(start, stop, num)
+    else:
+        grid = start + (stop - start) * unit_grid
+        grid[-1] = stop
+    return tuple(grid.tolist())
+
+
 def _geometric_progression(rmin, rmax, npoints, gfact=1.1, rstp=0.05):
     """ Build a grid using a geometric progresion
     """
-    grid = [rmin]
-    rgrid = rmin
-    for _ in range(npoints):
-        rgrid += rstp
-        if rgrid == rmax:
-            break
-        grid.append(rgrid)
-        rstp = rstp * gfact
-    grid = numpy.array(grid)
+    # steps are rstp, rstp*gfact, rstp*gfact**2, ...; the running sums give
+    # the same values as adding them one at a time
+    steps = numpy.full(npoints, gfact)
+    steps[:1] = rstp
+    steps = numpy.cumprod(steps)
+    grid = numpy.cumsum(numpy.concatenate(([rmin], steps)))
+
+    # stop the grid short of any point that lands exactly on rmax
+    hit_idxs = numpy.flatnonzero(grid[1:] == rmax)
+    if hit_idxs.size:
+        grid = grid[:hit_idxs[0]+1]
 
     return grid
 
 
+_TIGHT_TS_GRID_BUILDERS = {
+    ReactionClass.BETA_SCISSION: beta_scission_grid,
+    ReactionClass.ADDITION: addition_grid,
+    ReactionClass.HYDROGEN_MIGRATION: hydrogen_migration_grid,
+    ReactionClass.ELIMINATION: elimination_grid,
+    ReactionClass.RING_FORM_SCISSION: ring_forming_scission_grid,
+    ReactionClass.HYDROGEN_ABSTRACTION: hydrogen_abstraction_grid,
+    ReactionClass.SUBSTITUTION: substitution_grid,
+    ReactionClass.INSERTION: insertion_grid
+}
+
+# _VAR_TS_GRID_BUILDERS = {
+#     ReactionClass.ADDITION: radrad_addition_grid,
+#     ReactionClass.HYDROGEN_ABSTRACTION: radrad_hydrogen_abstraction_grid
+# }
+
+
 def scan_grid(zrxn, zma):
     """ Set the grid for a transition state search
 
@@ -515,23 +573,7 @@ def scan_grid(zrxn, zma):
         # Pass npoints as a 2-element list
     """
 
-    tight_ts_grid_builder_dct = {
-        ReactionClass.BETA_SCISSION: beta_scission_grid,
-        ReactionClass.ADDITION: addition_grid,
-        ReactionClass.HYDROGEN_MIGRATION: hydrogen_migration_grid,
-        ReactionClass.ELIMINATION: elimination_grid,
-        ReactionClass.RING_FORM_SCISSION: ring_forming_scission_grid,
-        ReactionClass.HYDROGEN_ABSTRACTION: hydrogen_abstraction_grid,
-        ReactionClass.SUBSTITUTION: substitution_grid,
-        ReactionClass.INSERTION: insertion_grid
-    }
-
-    # var_ts_grid_builder_dct = {
-    #     ReactionClass.ADDITION: radrad_addition_grid,
-    #     ReactionClass.HYDROGEN_ABSTRACTION: radrad_hydrogen_abstraction_grid
-    # }
-
-    grid = tight_ts_grid_builder_dct[zrxn.class_](zrxn, zma)
+    grid = _TIGHT_TS_GRID_BUILDERS[zrxn.class_](zrxn, zma)
 
     # Set the main type
     # if radrad and spin == 'low':
@@ -1,10 +1,36 @@
 """ Common utilities for reaction classes
 """
+import functools
+import multiprocessing
+import concurrent.futures
+import concurrent.futures.process
 import automol.graph
 from automol.graph import ts
+from automol.graph._util import freeze
+from automol.graph._util import thaw
 from automol import par
 
 
+def _split_shared_atom_key(bnd_key1, bnd_key2):
+    """ Split two bond keys that share exactly one atom.
+
+    :param bnd_key1: the first bond key
+    :type bnd_key1: frozenset[int]
+    :param bnd_key2: the second bond key
+    :type bnd_key2: frozenset[int]
+    :returns: the shared atom, the other atom in the first bond, and the other
+        atom in the second bond
+    :rtype: (int, int, int)
+    """
+    key1, key2 = bnd_key1
+    shr_key, only1_key = (key1, key2) if key1 in bnd_key2 else (key2, key1)
+    assert shr_key in bnd_key2, (
+        "{} and {} do not share an atom".format(bnd_key1, bnd_key2))
+    key3, key4 = bnd_key2
+    only2_key = key4 if key3 == shr_key else key3
+    return shr_key, only1_key, only2_key
+
+
 def hydrogen_migration_atom_keys(rxn):
     """ Obtain the atoms involved in a hydrogen migration reaction, sorted in
     canonical order.
@@ -15,19 +41,41 @@ def hydrogen_migration_atom_keys(rxn):
     a neighbor to the attacking atom along the chain to the donating atom
     :rtype: (int, int, int, int)
     """
-    frm_bnd_key, = ts.forming_bond_keys(rxn.forward_ts_graph)
-    brk_bnd_key, = ts.breaking_bond_keys(rxn.forward_ts_graph)
-    tra_key, = frm_bnd_key & brk_bnd_key
-    att_key, = frm_bnd_key - brk_bnd_key
-    don_key, = brk_bnd_key - frm_bnd_key
+    return _hydrogen_migration_chain_atom_keys(freeze(rxn.forward_ts_graph))
+
+
+@functools.lru_cache(maxsize=128)
+def _hydrogen_migration_chain_atom_keys(frz_tsg):
+    """ Obtain the hydrogen migration atoms from the TS graph, cached on its
+    hashable form
+    """
+    tsg = thaw(frz_tsg)
+    (frm_bnd_key,), (brk_bnd_key,) = ts.forming_and_breaking_bond_keys(tsg)
+    tra_key, att_key, don_key = _split_shared_atom_key(
+        frm_bnd_key, brk_bnd_key)
 
-    gra = ts.reactants_graph(rxn.forward_ts_graph)
+    gra = ts.reactants_graph(tsg)
     path = automol.graph.shortest_path_between_atoms(gra, att_key, don_key)
     ngb_key = automol.graph.atom_neighbor_atom_key(
         gra, att_key, incl_atm_keys=path)
     return att_key, tra_key, don_key, ngb_key
 
 
+def _hydrogen_migration_atom_keys(rxn):
+    """ Obtain the attacking, transferring, and donating atoms in a hydrogen
+    migration, without the neighbor of the attacking atom
+
+    :param rxn: the reaction object
+    :type rxn: Reaction
+    :rtype: (int, int, int)
+    """
+    (frm_bnd_key,), (brk_bnd_key,) = ts.forming_and_breaking_bond_keys(
+        rxn.forward_ts_graph)
+    tra_key, att_key, don_key = _split_shared_atom_key(
+        frm_bnd_key, brk_bnd_key)
+    return att_key, tra_key, don_key
+
+
 def ring_forming_scission_atom_keys(rxn):
     """ Obtain the atoms involved in a ring-forming scission reaction, sorted in
     canonical order.
@@ -37,11 +85,10 @@ def ring_forming_scission_atom_keys(rxn):
     :returns: the attacking atom, the transferring atom, the donating atom
     :rtype: (int, int, int, int)
     """
-    frm_bnd_key, = ts.forming_bond_keys(rxn.forward_ts_graph)
-    brk_bnd_key, = ts.breaking_bond_keys(rxn.forward_ts_graph)
-    tra_key, = frm_bnd_key & brk_bnd_key
-    att_key, = frm_bnd_key - brk_bnd_key
-    don_key, = brk_bnd_key - frm_bnd_key
+    (frm_bnd_key,), (brk_bnd_key,) = ts.forming_and_breaking_bond_keys(
+        rxn.forward_ts_graph)
+    tra_key, att_key, don_key = _split_shared_atom_key(
+        frm_bnd_key, brk_bnd_key)
     return att_key, tra_key, don_key
 
 
@@ -54,8 +101,18 @@ def ring_forming_scission_chain(rxn):
     :returns: atoms along the chain
     :rtype: tuple[int]
     """
-    att_key, _, don_key = ring_forming_scission_atom_keys(rxn)
-    gra = ts.reactants_graph(rxn.forward_ts_graph)
+    return _ring_forming_scission_chain(freeze(rxn.forward_ts_graph))
+
+
+@functools.lru_cache(maxsize=128)
+def _ring_forming_scission_chain(frz_tsg):
+    """ Obtain the ring-forming scission chain from the TS graph, cached on its
+    hashable form
+    """
+    tsg = thaw(frz_tsg)
+    (frm_bnd_key,), (brk_bnd_key,) = ts.forming_and_breaking_bond_keys(tsg)
+    _, att_key, don_key = _split_shared_atom_key(frm_bnd_key, brk_bnd_key)
+    gra = ts.reactants_graph(tsg)
     path = automol.graph.shortest_path_between_atoms(gra, don_key, att_key)
     return tuple(path)
 
@@ -69,11 +126,10 @@ def hydrogen_abstraction_atom_keys(rxn):
     :returns: the attacking atom, the transferring atom, the donating atom
     :rtype: (int, int, int)
     """
-    frm_bnd_key, = ts.forming_bond_keys(rxn.forward_ts_graph)
-    brk_bnd_key, = ts.breaking_bond_keys(rxn.forward_ts_graph)
-    hyd_key, = frm_bnd_key & brk_bnd_key
-    att_key, = frm_bnd_key - brk_bnd_key
-    don_key, = brk_bnd_key - frm_bnd_key
+    (frm_bnd_key,), (brk_bnd_key,) = ts.forming_and_breaking_bond_keys(
+        rxn.forward_ts_graph)
+    hyd_key, att_key, don_key = _split_shared_atom_key(
+        frm_bnd_key, brk_bnd_key)
     return att_key, hyd_key, don_key
 
 
@@ -85,13 +141,20 @@ def hydrogen_abstraction_is_sigma(rxn):
     :rtype: bool
     """
     assert rxn.class_ == par.ReactionClass.HYDROGEN_ABSTRACTION
-    tsg = rxn.forward_ts_graph
-    rct_gra = automol.graph.ts.reactants_graph(tsg)
+    return _hydrogen_abstraction_is_sigma(freeze(rxn.forward_ts_graph))
+
+
+@functools.lru_cache(maxsize=128)
+def _hydrogen_abstraction_is_sigma(frz_tsg):
+    """ Is this a sigma radical hydrogen abstraction? Cached on the hashable
+    form of the TS graph
+    """
+    tsg = thaw(frz_tsg)
+    rct_gra = ts.reactants_graph(tsg)
     sig_rad_keys = automol.graph.sigma_radical_atom_keys(rct_gra)
 
-    brk_bnd_key, = ts.breaking_bond_keys(tsg)
-    frm_bnd_key, = ts.forming_bond_keys(tsg)
-    rad_key, = frm_bnd_key - brk_bnd_key
+    (frm_bnd_key,), (brk_bnd_key,) = ts.forming_and_breaking_bond_keys(tsg)
+    _, rad_key, _ = _split_shared_atom_key(frm_bnd_key, brk_bnd_key)
     return rad_key in sig_rad_keys
 
 
@@ -105,13 +168,12 @@ def insertion_forming_bond_keys(rxn):
     :rtype: (frozenset[int], frozenset[int])
     """
     assert rxn.class_ == par.ReactionClass.INSERTION
-    brk_bnd_key, = ts.breaking_bond_keys(rxn.forward_ts_graph)
+    frm_bnd_keys, (brk_bnd_key,) = ts.forming_and_breaking_bond_keys(
+        rxn.forward_ts_graph)
     # Choose the forming bond that doesn't intersect with the breaking bond, if
     # one of them does
-    frm_bnd_keys = sorted(ts.forming_bond_keys(rxn.forward_ts_graph),
-                          key=sorted)
     frm_bnd_keys = sorted(frm_bnd_keys,
-                          key=lambda x: len(x & brk_bnd_key))
+                          key=lambda x: (len(x & brk_bnd_key), sorted(x)))
     return tuple(frm_bnd_keys)
 
 
@@ -124,36 +186,74 @@ def substitution_atom_keys(rxn):
     :returns: the attacking atom, the transferring atom, the leaving atom
     :rtype: (int, int, int)
     """
-    frm_bnd_key, = ts.forming_bond_keys(rxn.forward_ts_graph)
-    brk_bnd_key, = ts.breaking_bond_keys(rxn.forward_ts_graph)
-    tra_key, = frm_bnd_key & brk_bnd_key
-    att_key, = frm_bnd_key - brk_bnd_key
-    lea_key, = brk_bnd_key - frm_bnd_key
+    (frm_bnd_key,), (brk_bnd_key,) = ts.forming_and_breaking_bond_keys(
+        rxn.forward_ts_graph)
+    tra_key, att_key, lea_key = _split_shared_atom_key(
+        frm_bnd_key, brk_bnd_key)
     return att_key, tra_key, lea_key
 
 
 # Get a reaction object from various identifiers
-def rxn_objs_from_inchi(rct_ichs, prd_ichs, indexing='geo'):
+def _geometries_from_inchis(rct_ichs, prd_ichs, nprocs=1):
+    """ Generate reactant and product geometries from InChI strings
+
+    If more than one process is requested, the conversions are run on a
+    process pool that lives only for this call. Worker processes are spawned
+    rather than forked, since RDKit is already loaded in this one. The
+    conversions fall back to running serially if the pool can't be started
+    or breaks, or from inside a daemonic worker process. Errors raised by the
+    conversions themselves are passed on.
+
+    :param nprocs: the number of processes to run the conversions on
+    :type nprocs: int
+    """
+    rct_ichs = list(rct_ichs)
+    prd_ichs = list(prd_ichs)
+    ichs = rct_ichs + prd_ichs
+
+    geos = None
+    if nprocs > 1 and not multiprocessing.current_process().daemon:
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=nprocs,
+                    mp_context=multiprocessing.get_context('spawn')) as pool:
+                geos = list(pool.map(automol.inchi.geometry, ichs))
+        except (OSError, concurrent.futures.process.BrokenProcessPool):
+            geos = None
+
+    if geos is None:
+        geos = list(map(automol.inchi.geometry, ichs))
+
+    rct_geos = geos[:len(rct_ichs)]
+    prd_geos = geos[len(rct_ichs):]
+    return rct_geos, prd_geos
+
+
+def rxn_objs_from_inchi(rct_ichs, prd_ichs, indexing='geo', nprocs=1):
     """ Generate obj
+
+    :param nprocs: the number of processes to generate geometries on
     """
 
-    rct_geos = list(map(automol.inchi.geometry, rct_ichs))
-    prd_geos = list(map(automol.inchi.geometry, prd_ichs))
+    rct_geos, prd_geos = _geometries_from_inchis(
+        rct_ichs, prd_ichs, nprocs=nprocs)
 
     return rxn_objs_from_geometry(
         rct_geos, prd_geos, indexing=indexing)
 
 
-def rxn_objs_from_smiles(rct_smis, prd_smis, indexing='geo'):
+def rxn_objs_from_smiles(rct_smis, prd_smis, indexing='geo', nprocs=1):
     """ Generate obj
+
+    :param nprocs: the number of processes to generate geometries on
     """
 
     # Is this adding stero? prob should?
     rct_ichs = list(map(automol.smiles.inchi, rct_smis))
     prd_ichs = list(map(automol.smiles.inchi, prd_smis))
 
-    rct_geos = list(map(automol.inchi.geometry, rct_ichs))
-    prd_geos = list(map(automol.inchi.geometry, prd_ichs))
+    rct_geos, prd_geos = _geometries_from_inchis(
+        rct_ichs, prd_ichs, nprocs=nprocs)
 
     return rxn_objs_from_geometry(
         rct_geos, prd_geos, indexing=indexing)
@@ -185,6 +285,12 @@ def rxn_objs_from_geometry(rct_geos, prd_geos, indexing='geo'):
 
     rxns = automol.reac.find(rct_gras, prd_gras)
 
+    # The reactant and product z-matrices don't depend on the reaction, so
+    # only build them once
+    if indexing == 'zma':
+        rct_zmas = tuple(map(automol.geom.zmatrix, rct_geos))
+        prd_zmas = tuple(map(automol.geom.zmatrix, prd_geos))
+
     # Obtain the reaction objects and structures to return
     rxn_objs = tuple()
     for rxn in rxns:
@@ -201,8 +307,6 @@ def rxn_objs_from_geometry(rct_geos, prd_geos, indexing='geo'):
                 std_rxn, ts_geo)
             std_zrxn = automol.reac.relabel_for_zmatrix(
                 std_rxn, zma_keys, dummy_key_dct)
-            rct_zmas = tuple(map(automol.geom.zmatrix, rct_geos))
-            prd_zmas = tuple(map(automol.geom.zmatrix, prd_geos))
 
             rxn_objs += ((std_zrxn, ts_zma, rct_zmas, prd_zmas),)
 
@@ -210,8 +314,8 @@ def rxn_objs_from_geometry(rct_geos, prd_geos, indexing='geo'):
 
 
 if __name__ == '__main__':
-    rct_ichs, prd_ichs = [
+    RCT_ICHS, PRD_ICHS = [
         ['InChI=1S/C7H14/c1-6(2)5-7(3)4/h7H,1,5H2,2-4H3',
          'InChI=1S/CH3/h1H3'],
         ['InChI=1S/C8H17/c1-7(2)6-8(3,4)5/h7H,3,6H2,1-2,4-5H3']]
-    rxn_objs_from_inchi(rct_ichs, prd_ichs)
+    rxn_objs_from_inchi(RCT_ICHS, PRD_ICHS)
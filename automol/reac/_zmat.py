@@ -1,43 +1,142 @@
 """ TS z-matrices for specific reaction classes
 """
+import functools
 import automol.geom
 import automol.graph
 from automol import par
 from automol.graph import ts
+from automol.graph._util import freeze
+from automol.graph._util import thaw
 from automol.reac._reac import add_dummy_atoms
-from automol.reac._util import hydrogen_migration_atom_keys
-from automol.reac._util import ring_forming_scission_atom_keys
 from automol.reac._util import insertion_forming_bond_keys
 from automol.reac._util import hydrogen_abstraction_atom_keys
 from automol.reac._util import hydrogen_abstraction_is_sigma
 from automol.reac._util import substitution_atom_keys
+from automol.reac._util import _hydrogen_migration_atom_keys
 
 
-# Unimolecular reactions
-# 1. Hydrogen migrations
-def hydrogen_migration_ts_zmatrix(rxn, ts_geo):
-    """ z-matrix for a hydrogen migration transition state geometry
+@functools.lru_cache(maxsize=128)
+def _linear_atoms(ts_geo):
+    """ Linear atoms in the TS geometry, cached on the geometry itself
+    """
+    return automol.geom.linear_atoms(ts_geo)
+
+
+@functools.lru_cache(maxsize=64)
+def _insert_dummies_on_linear_atoms(ts_geo, lin_idxs, frz_tsg):
+    """ Insert dummy atoms over linear atoms in the TS geometry, cached on the
+    geometry, the linear atom keys, and the hashable form of the TS graph
+    """
+    gra = ts.reactants_graph(thaw(frz_tsg))
+    return automol.geom.insert_dummies_on_linear_atoms(
+        ts_geo, lin_idxs=lin_idxs, gra=gra)
+
+
+@functools.lru_cache(maxsize=128)
+def _forming_rings_atom_keys(frz_tsg):
+    """ Atom keys of the rings forming in the TS graph, cached on its hashable
+    form
+    """
+    return ts.forming_rings_atom_keys(thaw(frz_tsg))
+
+
+def _prepare_ts(rxn, ts_geo, extra_lin_idxs=(), sort=False):
+    """ Add dummy atoms over the linear atoms of a TS geometry, along with the
+    corresponding dummy atoms in the Reaction object
 
     :param rxn: a Reaction object
     :param ts_geo: a transition state geometry
+    :param extra_lin_idxs: additional atoms to treat as linear
+    :param sort: sort the linear atom keys before inserting dummy atoms?
+    :returns: the Reaction object and geometry with dummy atoms, and the
+        dummy index dictionary
     """
-    rxn = rxn.copy()
-
     # 1. Get keys to linear or near-linear atoms
-    lin_idxs = list(automol.geom.linear_atoms(ts_geo))
+    lin_idxs = list(_linear_atoms(ts_geo))
+    for key in extra_lin_idxs:
+        if key not in lin_idxs:
+            lin_idxs.append(key)
+    if sort:
+        lin_idxs = sorted(lin_idxs)
+
+    # With no linear atoms, the geometry and reaction are left as they are
+    if not lin_idxs:
+        return rxn, ts_geo, {}
 
     # 2. Add dummy atoms over the linear atoms
-    rcts_gra = ts.reactants_graph(rxn.forward_ts_graph)
-    geo, dummy_key_dct = automol.geom.insert_dummies_on_linear_atoms(
-        ts_geo, lin_idxs=lin_idxs, gra=rcts_gra)
+    geo, dummy_key_dct = _insert_dummies_on_linear_atoms(
+        ts_geo, tuple(lin_idxs), freeze(rxn.forward_ts_graph))
+    dummy_key_dct = dict(dummy_key_dct)
 
     # 3. Add dummy atoms to the Reaction object as well
     rxn = add_dummy_atoms(rxn, dummy_key_dct)
 
+    return rxn, geo, dummy_key_dct
+
+
+def _nearest_bond_atom_keys(gra, bnd_key, grp_keys):
+    """ Split a bond into the atom nearest to a group of atoms and the other
+    atom
+
+    Runs a breadth-first search outward from the group, stopping at the first
+    layer that reaches the bond, rather than finding all shortest paths. If
+    both atoms of the bond are reached in the same layer, they are equally
+    near the group, and the lower atom key is taken as the nearer atom.
+
+    :param gra: the graph
+    :param bnd_key: the bond key
+    :param grp_keys: the keys of the group of atoms, not overlapping the bond
+    :returns: the nearer atom and the farther atom of the bond
+    :rtype: (int, int)
+    """
+    ngb_keys_dct = automol.graph.atoms_neighbor_atom_keys(gra)
+
+    seen_keys = set(grp_keys)
+    lyr_keys = set(grp_keys)
+    while lyr_keys:
+        near_keys = [k for k in bnd_key if k in lyr_keys]
+        if near_keys:
+            key1 = min(near_keys)
+            key2, = bnd_key - {key1}
+            return key1, key2
+
+        lyr_keys = set().union(
+            *map(ngb_keys_dct.__getitem__, lyr_keys)) - seen_keys
+        seen_keys |= lyr_keys
+
+    raise AssertionError(
+        "Bond {} is not connected to {}".format(set(bnd_key), set(grp_keys)))
+
+
+def _bimolecular_vmatrix(rxn):
+    """ V-matrix for a bimolecular TS, built one reactant after the other
+
+    :param rxn: a Reaction object
+    :returns: the v-matrix and the row keys
+    """
+    tsg = rxn.forward_ts_graph
+    rct1_keys, rct2_keys = rxn.reactants_keys
+    vma, zma_keys = automol.graph.vmat.vmatrix(tsg, rct1_keys)
+    vma, zma_keys = automol.graph.vmat.continue_vmatrix(
+        tsg, rct2_keys, vma, zma_keys)
+    return vma, zma_keys
+
+
+# Unimolecular reactions
+# 1. Hydrogen migrations
+def hydrogen_migration_ts_zmatrix(rxn, ts_geo):
+    """ z-matrix for a hydrogen migration transition state geometry
+
+    :param rxn: a Reaction object
+    :param ts_geo: a transition state geometry
+    """
+    # 1-3. Add dummy atoms over linear atoms to the geometry and reaction
+    rxn, geo, dummy_key_dct = _prepare_ts(rxn, ts_geo)
+
     # 4. Generate a z-matrix for the geometry
     # Start the z-matrix from the forming bond ring
-    rng_keys, = ts.forming_rings_atom_keys(rxn.forward_ts_graph)
-    _, hyd_key, don_key, _ = hydrogen_migration_atom_keys(rxn)
+    rng_keys, = _forming_rings_atom_keys(freeze(rxn.forward_ts_graph))
+    _, hyd_key, don_key = _hydrogen_migration_atom_keys(rxn)
     # Cycle the migrating h to the front of the ring keys and, if
     # needed, reverse the ring so that the donating atom is last:
     #       (migrating h atom, attacking atom, ... , donating atom)
@@ -48,8 +147,7 @@ def hydrogen_migration_ts_zmatrix(rxn, ts_geo):
     vma, zma_keys = automol.graph.vmat.vmatrix(
         rxn.forward_ts_graph, rng_keys=rng_keys)
 
-    zma_geo = automol.geom.from_subset(geo, zma_keys)
-    zma = automol.zmat.from_geometry(vma, zma_geo)
+    zma = automol.zmat.from_geometry_subset(vma, geo, zma_keys)
 
     return zma, zma_keys, dummy_key_dct
 
@@ -61,24 +159,13 @@ def beta_scission_ts_zmatrix(rxn, ts_geo):
     :param rxn: a Reaction object
     :param ts_geo: a transition state geometry
     """
-    rxn = rxn.copy()
-
-    # 1. Get keys to linear or near-linear atoms
-    lin_idxs = list(automol.geom.linear_atoms(ts_geo))
-
-    # 2. Add dummy atoms over the linear atoms
-    rcts_gra = ts.reactants_graph(rxn.forward_ts_graph)
-    geo, dummy_key_dct = automol.geom.insert_dummies_on_linear_atoms(
-        ts_geo, lin_idxs=lin_idxs, gra=rcts_gra)
-
-    # 3. Add dummy atoms to the Reaction object as well
-    rxn = add_dummy_atoms(rxn, dummy_key_dct)
+    # 1-3. Add dummy atoms over linear atoms to the geometry and reaction
+    rxn, geo, dummy_key_dct = _prepare_ts(rxn, ts_geo)
 
     # 4. Generate a z-matrix for the geometry
     vma, zma_keys = automol.graph.vmat.vmatrix(rxn.forward_ts_graph)
 
-    zma_geo = automol.geom.from_subset(geo, zma_keys)
-    zma = automol.zmat.from_geometry(vma, zma_geo)
+    zma = automol.zmat.from_geometry_subset(vma, geo, zma_keys)
 
     return zma, zma_keys, dummy_key_dct
 
@@ -90,35 +177,13 @@ def ring_forming_scission_ts_zmatrix(rxn, ts_geo):
     :param rxn: a Reaction object
     :param ts_geo: a transition state geometry
     """
-    rxn = rxn.copy()
-
-    # 1. Get keys to linear or near-linear atoms
-    lin_idxs = list(automol.geom.linear_atoms(ts_geo))
-
-    # 2. Add dummy atoms over the linear atoms
-    rcts_gra = ts.reactants_graph(rxn.forward_ts_graph)
-    geo, dummy_key_dct = automol.geom.insert_dummies_on_linear_atoms(
-        ts_geo, lin_idxs=lin_idxs, gra=rcts_gra)
-
-    # 3. Add dummy atoms to the Reaction object as well
-    rxn = add_dummy_atoms(rxn, dummy_key_dct)
+    # 1-3. Add dummy atoms over linear atoms to the geometry and reaction
+    rxn, geo, dummy_key_dct = _prepare_ts(rxn, ts_geo)
 
     # 4. Generate a z-matrix for the geometry
-    rng_keys, = ts.forming_rings_atom_keys(rxn.forward_ts_graph)
-    att_key, tra_key, _ = ring_forming_scission_atom_keys(rxn)
-    # First, cycle the transferring atom to the front of the ring keys and, if
-    # needed, reverse the ring so that the attacking atom is last
-    #       (transferring atom, ... , atom, attackin atom)
-    rng_keys = automol.graph.cycle_ring_atom_key_to_front(
-        rng_keys, tra_key, end_key=att_key)
-    # Now, cycle the secont-to-last key to the front so that the ring order is:
-    #       (atom, attacking atom, transferring atom, ....)
-    rng_keys = automol.graph.cycle_ring_atom_key_to_front(
-        rng_keys, rng_keys[-2])
     vma, zma_keys = automol.graph.vmat.vmatrix(rxn.forward_ts_graph)
 
-    zma_geo = automol.geom.from_subset(geo, zma_keys)
-    zma = automol.zmat.from_geometry(vma, zma_geo)
+    zma = automol.zmat.from_geometry_subset(vma, geo, zma_keys)
 
     return zma, zma_keys, dummy_key_dct
 
@@ -130,46 +195,32 @@ def elimination_ts_zmatrix(rxn, ts_geo):
     :param rxn: a Reaction object
     :param ts_geo: a transition state geometry
     """
-    rxn = rxn.copy()
-
-    # 1. Get keys to linear or near-linear atoms
-    lin_idxs = list(automol.geom.linear_atoms(ts_geo))
-
-    # 2. Add dummy atoms over the linear atoms
-    rcts_gra = ts.reactants_graph(rxn.forward_ts_graph)
-    geo, dummy_key_dct = automol.geom.insert_dummies_on_linear_atoms(
-        ts_geo, lin_idxs=lin_idxs, gra=rcts_gra)
-
-    # 3. Add dummy atoms to the Reaction object as well
-    rxn = add_dummy_atoms(rxn, dummy_key_dct)
+    # 1-3. Add dummy atoms over linear atoms to the geometry and reaction
+    rxn, geo, dummy_key_dct = _prepare_ts(rxn, ts_geo)
 
     # 4. Generate a z-matrix for the geometry
-    rng_keys, = ts.forming_rings_atom_keys(rxn.forward_ts_graph)
-    frm_bnd_key, = ts.forming_bond_keys(rxn.forward_ts_graph)
+    rng_keys, = _forming_rings_atom_keys(freeze(rxn.forward_ts_graph))
+    (frm_bnd_key,), brk_bnd_keys = ts.forming_and_breaking_bond_keys(
+        rxn.forward_ts_graph)
     # Drop one of the breaking bonds from the z-matrix by sorting the ring atom
     # keys to exclude it. If one of the breaking bonds intersects with the
     # forming bond, choose the other one.
-    brk_bnd_keys = sorted(ts.breaking_bond_keys(rxn.forward_ts_graph),
-                          key=lambda x: len(x & frm_bnd_key))
-    brk_bnd_key = brk_bnd_keys[0]
+    brk_bnd_key = min(brk_bnd_keys, key=lambda x: len(x & frm_bnd_key))
     # Cycle the ring keys such that the atom closest to the forming bond is the
     # beginning of the ring and the other atom is the end
-    if brk_bnd_key & frm_bnd_key:
-        key1, = brk_bnd_key & frm_bnd_key
-        key2, = brk_bnd_key - frm_bnd_key
-    else:
-        path = automol.graph.shortest_path_between_groups(
+    key1, key2 = brk_bnd_key
+    if key2 in frm_bnd_key:
+        key1, key2 = key2, key1
+    elif key1 not in frm_bnd_key:
+        key1, key2 = _nearest_bond_atom_keys(
             rxn.forward_ts_graph, brk_bnd_key, frm_bnd_key)
-        key1, = brk_bnd_key & set(path)
-        key2, = brk_bnd_key - set(path)
     rng_keys = automol.graph.cycle_ring_atom_key_to_front(
         rng_keys, key1, end_key=key2)
 
     vma, zma_keys = automol.graph.vmat.vmatrix(
         rxn.forward_ts_graph, rng_keys=rng_keys)
 
-    zma_geo = automol.geom.from_subset(geo, zma_keys)
-    zma = automol.zmat.from_geometry(vma, zma_geo)
+    zma = automol.zmat.from_geometry_subset(vma, geo, zma_keys)
 
     return zma, zma_keys, dummy_key_dct
 
@@ -182,37 +233,21 @@ def hydrogen_abstraction_ts_zmatrix(rxn, ts_geo):
     :param rxn: a Reaction object
     :param ts_geo: a transition state geometry
     """
-    rxn = rxn.copy()
-
-    # 1. Get keys to linear or near-linear atoms
-    lin_idxs = list(automol.geom.linear_atoms(ts_geo))
-    # Add a dummy atom over the transferring hydrogen
+    # Add a dummy atom over the transferring hydrogen, and over the attacking
+    # atom for a sigma radical
     att_key, hyd_key, _ = hydrogen_abstraction_atom_keys(rxn)
-    lin_idxs.append(hyd_key)
-
+    extra_lin_idxs = [hyd_key]
     if hydrogen_abstraction_is_sigma(rxn):
-        if att_key not in lin_idxs:
-            lin_idxs.append(att_key)
+        extra_lin_idxs.append(att_key)
 
-    lin_idxs = sorted(lin_idxs)
-
-    # 2. Add dummy atoms over the linear atoms
-    rcts_gra = ts.reactants_graph(rxn.forward_ts_graph)
-    geo, dummy_key_dct = automol.geom.insert_dummies_on_linear_atoms(
-        ts_geo, lin_idxs=lin_idxs, gra=rcts_gra)
-
-    # 3. Add dummy atoms to the Reaction object as well
-    rxn = add_dummy_atoms(rxn, dummy_key_dct)
+    # 1-3. Add dummy atoms over linear atoms to the geometry and reaction
+    rxn, geo, dummy_key_dct = _prepare_ts(
+        rxn, ts_geo, extra_lin_idxs=extra_lin_idxs, sort=True)
 
     # 4. Generate a z-matrix for the geometry
-    tsg = rxn.forward_ts_graph
-    rct1_keys, rct2_keys = rxn.reactants_keys
-    vma, zma_keys = automol.graph.vmat.vmatrix(tsg, rct1_keys)
-    vma, zma_keys = automol.graph.vmat.continue_vmatrix(
-        tsg, rct2_keys, vma, zma_keys)
+    vma, zma_keys = _bimolecular_vmatrix(rxn)
 
-    zma_geo = automol.geom.from_subset(geo, zma_keys)
-    zma = automol.zmat.from_geometry(vma, zma_geo)
+    zma = automol.zmat.from_geometry_subset(vma, geo, zma_keys)
 
     return zma, zma_keys, dummy_key_dct
 
@@ -224,29 +259,13 @@ def addition_ts_zmatrix(rxn, ts_geo):
     :param rxn: a Reaction object
     :param ts_geo: a transition state geometry
     """
-    rxn = rxn.copy()
-    rxn.forward_ts_graph = rxn.forward_ts_graph
-
-    # 1. Get keys to linear or near-linear atoms
-    lin_idxs = list(automol.geom.linear_atoms(ts_geo))
-
-    # 2. Add dummy atoms over the linear atoms
-    rcts_gra = ts.reactants_graph(rxn.forward_ts_graph)
-    geo, dummy_key_dct = automol.geom.insert_dummies_on_linear_atoms(
-        ts_geo, lin_idxs=lin_idxs, gra=rcts_gra)
-
-    # 3. Add dummy atoms to the Reaction object as well
-    rxn = add_dummy_atoms(rxn, dummy_key_dct)
+    # 1-3. Add dummy atoms over linear atoms to the geometry and reaction
+    rxn, geo, dummy_key_dct = _prepare_ts(rxn, ts_geo)
 
     # 4. Generate a z-matrix for the geometry
-    tsg = rxn.forward_ts_graph
-    rct1_keys, rct2_keys = rxn.reactants_keys
-    vma, zma_keys = automol.graph.vmat.vmatrix(tsg, rct1_keys)
-    vma, zma_keys = automol.graph.vmat.continue_vmatrix(
-        tsg, rct2_keys, vma, zma_keys)
+    vma, zma_keys = _bimolecular_vmatrix(rxn)
 
-    zma_geo = automol.geom.from_subset(geo, zma_keys)
-    zma = automol.zmat.from_geometry(vma, zma_geo)
+    zma = automol.zmat.from_geometry_subset(vma, geo, zma_keys)
 
     return zma, zma_keys, dummy_key_dct
 
@@ -258,44 +277,32 @@ def insertion_ts_zmatrix(rxn, ts_geo):
     :param rxn: a Reaction object
     :param ts_geo: a transition state geometry
     """
-    rxn = rxn.copy()
-    rxn.forward_ts_graph = rxn.forward_ts_graph
-
-    # 1. Get keys to linear or near-linear atoms
-    lin_idxs = list(automol.geom.linear_atoms(ts_geo))
-
-    # 2. Add dummy atoms over the linear atoms
-    rcts_gra = ts.reactants_graph(rxn.forward_ts_graph)
-    geo, dummy_key_dct = automol.geom.insert_dummies_on_linear_atoms(
-        ts_geo, lin_idxs=lin_idxs, gra=rcts_gra)
-
-    # 3. Add dummy atoms to the Reaction object as well
-    rxn = add_dummy_atoms(rxn, dummy_key_dct)
+    # 1-3. Add dummy atoms over linear atoms to the geometry and reaction
+    rxn, geo, dummy_key_dct = _prepare_ts(rxn, ts_geo)
 
     # 4. Generate a z-matrix for the geometry
-    rng_keys, = ts.forming_rings_atom_keys(rxn.forward_ts_graph)
-    brk_bnd_key, = ts.breaking_bond_keys(rxn.forward_ts_graph)
+    rng_keys, = _forming_rings_atom_keys(freeze(rxn.forward_ts_graph))
+    _, (brk_bnd_key,) = ts.forming_and_breaking_bond_keys(
+        rxn.forward_ts_graph)
     # Drop one of the forming bonds from the z-matrix by sorting the ring atom
     # keys to exclude it. If one of the forming bonds intersects with the
     # breaking bond, choose that one.
     _, frm_bnd_key = insertion_forming_bond_keys(rxn)
     # Cycle the ring keys such that the atom closest to the breaking bond is
     # the beginning of the ring and the other atom is the end
-    if frm_bnd_key & brk_bnd_key:
-        key1, = frm_bnd_key & brk_bnd_key
-        key2, = frm_bnd_key - brk_bnd_key
-    else:
-        path = automol.graph.shortest_path_between_groups(
+    key1, key2 = frm_bnd_key
+    if key2 in brk_bnd_key:
+        key1, key2 = key2, key1
+    elif key1 not in brk_bnd_key:
+        key1, key2 = _nearest_bond_atom_keys(
             rxn.forward_ts_graph, frm_bnd_key, brk_bnd_key)
-        key2, = frm_bnd_key - set(path)
     rng_keys = automol.graph.cycle_ring_atom_key_to_front(
         rng_keys, key1, end_key=key2)
 
     vma, zma_keys = automol.graph.vmat.vmatrix(
         rxn.forward_ts_graph, rng_keys=rng_keys)
 
-    zma_geo = automol.geom.from_subset(geo, zma_keys)
-    zma = automol.zmat.from_geometry(vma, zma_geo)
+    zma = automol.zmat.from_geometry_subset(vma, geo, zma_keys)
 
     return zma, zma_keys, dummy_key_dct
 
@@ -307,36 +314,35 @@ def substitution_ts_zmatrix(rxn, ts_geo):
     :param rxn: a Reaction object
     :param ts_geo: a transition state geometry
     """
-    rxn = rxn.copy()
-    rxn.forward_ts_graph = rxn.forward_ts_graph
-
-    # 1. Get keys to linear or near-linear atoms
-    lin_idxs = list(automol.geom.linear_atoms(ts_geo))
     # Add a dummy atom over the transferring hydrogen
     _, tra_key, _ = substitution_atom_keys(rxn)
-    lin_idxs.append(tra_key)
 
-    # 2. Add dummy atoms over the linear atoms
-    rcts_gra = ts.reactants_graph(rxn.forward_ts_graph)
-    geo, dummy_key_dct = automol.geom.insert_dummies_on_linear_atoms(
-        ts_geo, lin_idxs=lin_idxs, gra=rcts_gra)
-
-    # 3. Add dummy atoms to the Reaction object as well
-    rxn = add_dummy_atoms(rxn, dummy_key_dct)
+    # 1-3. Add dummy atoms over linear atoms to the geometry and reaction
+    rxn, geo, dummy_key_dct = _prepare_ts(
+        rxn, ts_geo, extra_lin_idxs=(tra_key,))
 
     # 4. Generate a z-matrix for the geometry
-    tsg = rxn.forward_ts_graph
-    rct1_keys, rct2_keys = rxn.reactants_keys
-    vma, zma_keys = automol.graph.vmat.vmatrix(tsg, rct1_keys)
-    vma, zma_keys = automol.graph.vmat.continue_vmatrix(
-        tsg, rct2_keys, vma, zma_keys)
+    vma, zma_keys = _bimolecular_vmatrix(rxn)
 
-    zma_geo = automol.geom.from_subset(geo, zma_keys)
-    zma = automol.zmat.from_geometry(vma, zma_geo)
+    zma = automol.zmat.from_geometry_subset(vma, geo, zma_keys)
 
     return zma, zma_keys, dummy_key_dct
 
 
+_TS_ZMATRIX_FNS = {
+    # unimolecular
+    par.ReactionClass.HYDROGEN_MIGRATION: hydrogen_migration_ts_zmatrix,
+    par.ReactionClass.BETA_SCISSION: beta_scission_ts_zmatrix,
+    par.ReactionClass.RING_FORM_SCISSION: ring_forming_scission_ts_zmatrix,
+    par.ReactionClass.ELIMINATION: elimination_ts_zmatrix,
+    # bimolecular
+    par.ReactionClass.HYDROGEN_ABSTRACTION: hydrogen_abstraction_ts_zmatrix,
+    par.ReactionClass.ADDITION: addition_ts_zmatrix,
+    par.ReactionClass.INSERTION: insertion_ts_zmatrix,
+    par.ReactionClass.SUBSTITUTION: substitution_ts_zmatrix,
+}
+
+
 def ts_zmatrix(rxn, ts_geo):
     """ reaction-class-specific embedding info
 
@@ -344,20 +350,6 @@ def ts_zmatrix(rxn, ts_geo):
     :param ts_geo: the TS geometry
     :returns: the TS z-matrix, the row keys, and the dummy index dictionary
     """
-    function_dct = {
-        # unimolecular
-        par.ReactionClass.HYDROGEN_MIGRATION: hydrogen_migration_ts_zmatrix,
-        par.ReactionClass.BETA_SCISSION: beta_scission_ts_zmatrix,
-        par.ReactionClass.RING_FORM_SCISSION: ring_forming_scission_ts_zmatrix,
-        par.ReactionClass.ELIMINATION: elimination_ts_zmatrix,
-        # bimolecular
-        par.ReactionClass.HYDROGEN_ABSTRACTION:
-        hydrogen_abstraction_ts_zmatrix,
-        par.ReactionClass.ADDITION: addition_ts_zmatrix,
-        par.ReactionClass.INSERTION: insertion_ts_zmatrix,
-        par.ReactionClass.SUBSTITUTION: substitution_ts_zmatrix,
-    }
-
-    fun_ = function_dct[rxn.class_]
+    fun_ = _TS_ZMATRIX_FNS[rxn.class_]
     ret = fun_(rxn, ts_geo)
     return ret
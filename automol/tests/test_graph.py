@@ -1,10 +1,14 @@
 """ test automol.graph
 """
 
+import itertools
+import functools
 import numpy
+import pytest
 import automol
 from automol import graph
 
+RNG = numpy.random.default_rng(0)
 
 C8H13O_CGR = (
     {0: ('C', 3, None), 1: ('C', 2, None), 2: ('C', 3, None),
@@ -527,7 +531,7 @@ def test__backbone_isomorphic():
     cgr = C8H13O_CGR
     natms = len(graph.atoms(cgr))
     for _ in range(10):
-        pmt_dct = dict(enumerate(numpy.random.permutation(natms)))
+        pmt_dct = dict(enumerate(RNG.permutation(natms)))
         cgr_pmt = graph.relabel(cgr, pmt_dct)
         assert graph.backbone_isomorphic(cgr, cgr_pmt)
 
@@ -538,11 +542,38 @@ def test__backbone_isomorphism():
     cgr = C8H13O_CGR
     natms = len(graph.atoms(cgr))
     for _ in range(10):
-        pmt_dct = dict(enumerate(numpy.random.permutation(natms)))
+        pmt_dct = dict(enumerate(RNG.permutation(natms)))
         cgr_pmt = graph.relabel(cgr, pmt_dct)
         assert graph.backbone_isomorphism(cgr, cgr_pmt) == pmt_dct
 
 
+def test__color_refinement_hash():
+    """ test graph.color_refinement_hash
+    """
+    # relabeled graphs hash the same, and are isomorphic
+    cgr = C8H13O_CGR
+    natms = len(graph.atoms(cgr))
+    for _ in range(10):
+        pmt_dct = dict(enumerate(RNG.permutation(natms)))
+        cgr_pmt = graph.relabel(cgr, pmt_dct)
+        assert (graph.color_refinement_hash(cgr) ==
+                graph.color_refinement_hash(cgr_pmt))
+        assert graph.backbone_isomorphism(cgr, cgr_pmt) == pmt_dct
+
+    # the last three resonances differ only by which bond is double
+    rgr_hashes = list(map(graph.color_refinement_hash, C3H3_RGRS))
+    assert rgr_hashes[1] == rgr_hashes[2] == rgr_hashes[3]
+    for rgr in C3H3_RGRS[2:]:
+        assert graph.backbone_isomorphic(C3H3_RGRS[1], rgr)
+
+    # non-isomorphic graphs are told apart
+    assert rgr_hashes[0] != rgr_hashes[1]
+    assert not graph.backbone_isomorphic(C3H3_RGRS[0], C3H3_RGRS[1])
+    assert (graph.color_refinement_hash(C8H13O_CGR) !=
+            graph.color_refinement_hash(C8H13O_RGR))
+    assert not graph.backbone_isomorphic(C8H13O_CGR, C8H13O_RGR)
+
+
 def test__backbone_unique():
     """ test graph.backbone_unique
     """
@@ -651,6 +682,30 @@ def test__resonance_dominant_bond_centered_cumulene_keys():
             frozenset({(frozenset({1, 4}), frozenset({3, 5}))}))
 
 
+def test__cumulene_chains():
+    """ test the cumulene chains behind the cumulene keys
+    """
+    # butatriene
+    cgr = ({0: ('C', 2, None), 1: ('C', 0, None), 2: ('C', 0, None),
+            3: ('C', 2, None)},
+           {frozenset({0, 1}): (1, None), frozenset({1, 2}): (1, None),
+            frozenset({2, 3}): (1, None)})
+    assert not graph.resonance_dominant_atom_centered_cumulene_keys(cgr)
+    assert graph.resonance_dominant_bond_centered_cumulene_keys(cgr) == (
+        frozenset({(frozenset({0, 3}), frozenset({1, 2}))}))
+
+    # the chain runs against the key order, next to an alkyne
+    cgr = ({0: ('C', 1, None), 1: ('C', 2, None), 2: ('C', 0, None),
+            3: ('C', 0, None), 4: ('C', 1, None), 5: ('C', 0, None),
+            6: ('C', 0, None)},
+           {frozenset({4, 6}): (1, None), frozenset({0, 2}): (1, None),
+            frozenset({2, 4}): (1, None), frozenset({5, 6}): (1, None),
+            frozenset({3, 5}): (1, None), frozenset({1, 3}): (1, None)})
+    assert graph.resonance_dominant_atom_centered_cumulene_keys(cgr) == (
+        frozenset({(frozenset({1, 4}), 5)}))
+    assert not graph.resonance_dominant_bond_centered_cumulene_keys(cgr)
+
+
 def test__resonance_dominant_radical_atom_keys():
     """ test graph.resonance_dominant_radical_atom_keys
     """
@@ -776,44 +831,40 @@ def test__stereomers():
     assert graph.stereomers(C8H13O_CGR) == C8H13O_SGRS
 
 
-def test__to_index_based_stereo():
+@pytest.mark.parametrize('sgr', list(itertools.chain(
+    C2H2CL2F2_SGRS, C3H3CL2F3_SGRS, C3H5N3_SGRS, C8H13O_SGRS)))
+def test__to_index_based_stereo(sgr):
     """ test graph.stereomers
     """
-    for sgr in C2H2CL2F2_SGRS:
-        sgr = graph.explicit(sgr)
-        idx_sgr = graph.to_index_based_stereo(sgr)
-        assert sgr == graph.from_index_based_stereo(idx_sgr)
+    sgr = graph.explicit(sgr)
+    idx_sgr = graph.to_index_based_stereo(sgr)
+    assert sgr == graph.from_index_based_stereo(idx_sgr)
 
-    for sgr in C3H3CL2F3_SGRS:
-        sgr = graph.explicit(sgr)
-        idx_sgr = graph.to_index_based_stereo(sgr)
-        assert sgr == graph.from_index_based_stereo(idx_sgr)
 
-    for sgr in C3H5N3_SGRS:
-        sgr = graph.explicit(sgr)
-        idx_sgr = graph.to_index_based_stereo(sgr)
-        assert sgr == graph.from_index_based_stereo(idx_sgr)
+@functools.lru_cache(maxsize=None)
+def _fused_ring_graph():
+    """ a graph with several fused ring systems, shared between tests
 
-    for sgr in C8H13O_SGRS:
-        sgr = graph.explicit(sgr)
-        idx_sgr = graph.to_index_based_stereo(sgr)
-        assert sgr == graph.from_index_based_stereo(idx_sgr)
+    (the InChI conversion is slow, so it is only done once)
+    """
+    ich = automol.smiles.inchi('C12CC(C1)C2CC3C(C3)CCC4C5CCC(CC5)C4')
+    return automol.inchi.graph(ich)
 
 
+@pytest.mark.slow
 def test__ring_systems():
     """ test graph.vmat.vmatrix
     """
-    ich = automol.smiles.inchi('C12CC(C1)C2CC3C(C3)CCC4C5CCC(CC5)C4')
-    gra = automol.inchi.graph(ich)
-    rsys = sorted(graph.ring_systems(gra), key=graph.atom_count)
-    assert list(map(graph.atom_count, rsys)) == [7, 12, 21]
+    gra = _fused_ring_graph()
+    natms = sorted(map(graph.atom_count, graph.ring_systems(gra)))
+    assert natms == [7, 12, 21]
 
 
+@pytest.mark.slow
 def test__vmat__vmatrix():
     """ test graph.vmat.vmatrix
     """
-    ich = automol.smiles.inchi('C12CC(C1)C2CC3C(C3)CCC4C5CCC(CC5)C4')
-    gra = automol.inchi.graph(ich)
+    gra = _fused_ring_graph()
     _, zma_keys = graph.vmat.vmatrix(gra)
     assert set(zma_keys) == graph.atom_keys(gra)
 
@@ -881,39 +932,3 @@ def test__ts__compatible_reverse_stereomers():
             for r in graph.ts.compatible_reverse_stereomers(ste_tsg)
             for s in graph.ts.compatible_reverse_stereomers(r)]
         assert any(s == ste_tsg for s in ste_tsgs)
-
-
-if __name__ == '__main__':
-    # test__from_data()
-    # test__set_atom_implicit_hydrogen_valences()
-    # test__without_bond_orders()
-    # test__without_stereo_parities()
-    # test__atom_explicit_hydrogen_valences()
-    # test__atom_explicit_hydrogen_keys()
-    # test__explicit()
-    # test__backbone_keys()
-    # test__explicit_hydrogen_keys()
-    # test__stereomers()
-    # test__heuristic_geometry()
-    # test__connected_components()
-    # test__unsaturated_atom_keys()
-    # test__bonds_neighbor_atom_keys()
-    # test__resonance_dominant_radical_atom_keys()
-    # test__remove_bonds()
-    # test__resonance_dominant_atom_centered_cumulene_keys()
-    # test__resonance_dominant_bond_centered_cumulene_keys()
-    # test__stereogenic_bond_keys()
-    # test__resonance_dominant_atom_hybridizations()
-    # test__rotational_bond_keys()
-    # test__electron_count()
-    # test__atom_count()
-    # test__heavy_atom_count()
-    # test__subresonances()
-    # test__sigma_radical_atom_keys()
-    # test__stereomers()
-    # test__to_index_based_stereo()
-    # test__ts__nonconserved_atom_stereo_keys()
-    # test__ts__nonconserved_bond_stereo_keys()
-    # test__ts__compatible_reverse_stereomers()
-    # test__vmat__vmatrix()
-    test__branch()
@@ -1,6 +1,9 @@
 """ test automol.reac BRUH
 """
 
+import concurrent.futures
+import numpy
+from phydat import phycon, bnd
 import automol
 
 SUBSTITUTION_RXN_STR = """
@@ -567,6 +570,10 @@ def test__reac__elimination():
     zma, zma_keys, dummy_key_dct = automol.reac.ts_zmatrix(rxn, geo)
     zrxn = automol.reac.relabel_for_zmatrix(rxn, zma_keys, dummy_key_dct)
 
+    # The C-O breaking bond doesn't share an atom with the forming H-O bond,
+    # so the ring starts from the breaking bond atom nearest to it
+    assert automol.zmat.symbols(zma)[:5] == ('O', 'O', 'H', 'C', 'C')
+
     # You can also do this to determine linear atoms from zmatrix:
     # bnd_keys = automol.reac.rotational_bond_keys(zrxn, zma=zma)
     bnd_keys = automol.reac.rotational_bond_keys(zrxn)
@@ -608,6 +615,40 @@ def test__reac__elimination():
         print('\tsymmetry number:', sym_num)
 
 
+def test__reac__elimination_grid():
+    """ test the elimination scan grid
+    """
+    rct_smis = ['CCCO[O]']
+    prd_smis = ['CC=C', 'O[O]']
+
+    rxn_objs = automol.reac.rxn_objs_from_smiles(rct_smis, prd_smis)
+    rxn, geo, _, _ = rxn_objs[0]
+    zma, zma_keys, dummy_key_dct = automol.reac.ts_zmatrix(rxn, geo)
+    zrxn = automol.reac.relabel_for_zmatrix(rxn, zma_keys, dummy_key_dct)
+
+    (scan_name,), _, (grid,), _ = automol.reac.build_scan_info(zrxn, zma)
+    assert scan_name == 'R2'
+
+    # The grid offsets are in angstrom and the reference bond length is
+    # already in bohr, so the grid must only be converted once
+    symbs = automol.zmat.symbols(zma)
+    dist_coo, = automol.zmat.coordinates(zma)[scan_name]
+    frm_bnd_len = automol.util.dict_.values_by_unordered_tuple(
+        bnd.LEN_DCT, tuple(sorted(map(symbs.__getitem__, dist_coo))))
+
+    grid1, grid2 = grid
+    assert len(grid1) == 8
+    assert len(grid2) == 4
+    assert numpy.isclose(grid1[0], frm_bnd_len + 0.2 * phycon.ANG2BOHR)
+    assert numpy.isclose(grid1[-1], frm_bnd_len + 1.4 * phycon.ANG2BOHR)
+
+    # The cached grids hit both endpoints exactly, as numpy.linspace does
+    r2min = (0.74 + 0.2) * phycon.ANG2BOHR
+    r2max = (0.74 + 0.8) * phycon.ANG2BOHR
+    assert grid2[0] == r2min and grid2[-1] == r2max
+    assert numpy.allclose(grid2, numpy.linspace(r2min, r2max, 4))
+
+
 def test__reac__hydrogen_abstraction():
     """ test hydrogen abstraction functionality
     """
@@ -1079,6 +1120,54 @@ def test__reac_util():
     assert zrxn1 == zrxn2
 
 
+def test__reac_util__pooled_geometries(monkeypatch):
+    """ test that the pooled InChI conversions run and match the serial ones
+    """
+    rct_smis = ['CCO', '[CH3]']
+    prd_smis = ['[CH2]CO', 'C']
+
+    # Record the conversions that finish on a pool, so that a silent fallback
+    # to the serial path would fail the test
+    pool_ichs = []
+
+    class _RecordingPool(concurrent.futures.ProcessPoolExecutor):
+        """ a process pool that records the conversions it finishes
+        """
+
+        def map(self, fn, *iterables, timeout=None, chunksize=1):
+            ichs, = iterables
+            ichs = list(ichs)
+            rets = list(super().map(
+                fn, ichs, timeout=timeout, chunksize=chunksize))
+            pool_ichs.extend(ichs)
+            return iter(rets)
+
+    monkeypatch.setattr(
+        concurrent.futures, 'ProcessPoolExecutor', _RecordingPool)
+
+    ser_rxn_objs = automol.reac.rxn_objs_from_smiles(
+        rct_smis, prd_smis, nprocs=1)
+    assert not pool_ichs
+
+    par_rxn_objs = automol.reac.rxn_objs_from_smiles(
+        rct_smis, prd_smis, nprocs=2)
+    assert pool_ichs == list(map(automol.smiles.inchi, rct_smis + prd_smis))
+
+    # The embedding isn't seeded, so compare what the geometries describe
+    # rather than their coordinates
+    def _describe(geos):
+        return [(automol.geom.symbols(g), automol.geom.connectivity_graph(g))
+                for g in geos]
+
+    assert len(par_rxn_objs) == len(ser_rxn_objs)
+    for par_rxn_obj, ser_rxn_obj in zip(par_rxn_objs, ser_rxn_objs):
+        par_rxn, _, par_rct_geos, par_prd_geos = par_rxn_obj
+        ser_rxn, _, ser_rct_geos, ser_prd_geos = ser_rxn_obj
+        assert par_rxn == ser_rxn
+        assert _describe(par_rct_geos) == _describe(ser_rct_geos)
+        assert _describe(par_prd_geos) == _describe(ser_prd_geos)
+
+
 def test__species__demo():
     """ doesn't really belong here, but demonstrates equivalent functionality
     for species
@@ -2,6 +2,7 @@
 """ test automol.zmat
 """
 import numpy
+from automol import vmat
 from automol import zmat
 
 CH4O2_ZMA = (
@@ -122,6 +123,40 @@ def test__string():
     assert zmat.almost_equal(zma, CH4O2_ZMA)
 
 
+def test__from_geometry_subset():
+    """ test zmat.from_geometry_subset
+    """
+    vma = vmat.from_data(zmat.symbols(CH4O2_ZMA),
+                         zmat.key_matrix(CH4O2_ZMA),
+                         zmat.name_matrix(CH4O2_ZMA))
+    geo = zmat.geometry(CH4O2_ZMA)
+
+    # using every atom matches building from the whole geometry
+    zma = zmat.from_geometry_subset(vma, geo, range(len(geo)))
+    assert zma == zmat.from_geometry(vma, geo)
+    assert zmat.almost_equal(zma, CH4O2_ZMA)
+
+    # a z-matrix with a dummy atom, measured from a shuffled subset of the
+    # atoms in a larger geometry
+    ref_zma = ()
+    ref_zma = zmat.add_atom(ref_zma, 'C', (), ())
+    ref_zma = zmat.add_atom(ref_zma, 'O', (0,), (1.4,))
+    ref_zma = zmat.add_atom(ref_zma, 'X', (0, 1), (1.0, 90.))
+    ref_zma = zmat.add_atom(ref_zma, 'H', (0, 1, 2), (1.1, 109.5, 120.))
+    ref_zma = zmat.add_atom(ref_zma, 'H', (1, 0, 2), (0.97, 107., 60.))
+    ref_vma = vmat.from_data(zmat.symbols(ref_zma),
+                             zmat.key_matrix(ref_zma),
+                             zmat.name_matrix(ref_zma))
+    ref_geo = zmat.geometry(ref_zma, dummy=True)
+    natms = len(ref_geo)
+
+    geo = ((('He', (5., 5., 5.)),) + tuple(reversed(ref_geo)) +
+           (('Ne', (-5., 0., 5.)),))
+    idxs = [natms - idx for idx in range(natms)]
+    zma = zmat.from_geometry_subset(ref_vma, geo, idxs)
+    assert zmat.almost_equal(zma, ref_zma)
+
+
 def test__distance():
     """ test zmat.distance
     """
@@ -134,4 +169,5 @@ if __name__ == '__main__':
     test__from_data()
     test__string()
     test__add_atom()
+    test__from_geometry_subset()
     test__distance()
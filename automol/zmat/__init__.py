@@ -2,6 +2,7 @@
 """
 # constructors
 from automol.zmat._zmat import from_geometry
+from automol.zmat._zmat import from_geometry_subset
 # converters
 from automol.zmat._zmat import geometry
 # getters
@@ -132,6 +133,7 @@ def formula(zma):
 __all__ = [
     # constructors
     'from_geometry',
+    'from_geometry_subset',
     # converters
     'geometry',
     # getters
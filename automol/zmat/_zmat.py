@@ -27,6 +27,21 @@ def from_geometry(vma, geo):
     return automol.convert.zmat.from_geometry(vma, geo)
 
 
+def from_geometry_subset(vma, geo, idxs):
+    """  Build a Z-Matrix from a V-Matrix and a subset of the atoms in a
+        molecular geometry, without building the subset geometry.
+
+        :param vma: V-Matrix
+        :type vma: automol V-Matrix data structure
+        :param geo: molecular geometry
+        :type geo: automol molecular geometry data structure
+        :param idxs: indices of the geometry atoms, in V-Matrix order
+        :type idxs: tuple(int)
+        :rtype: automol Z-Matrix data structure
+    """
+    return automol.convert.zmat.from_geometry_subset(vma, geo, idxs)
+
+
 # converters
 def geometry(zma, dummy=False):
     """ Convert a Z-Matrix to a molecular geometry.
@@ -1,28 +1,13 @@
 """ Install automol
 """
-from distutils.core import setup
+from setuptools import setup
+from setuptools import find_packages
 
 
 setup(name='automol',
       version='0.5.4',
-      packages=['automol',
-                'automol.convert',
-                'automol.create',
-                'automol.embed',
-                'automol.etrans',
-                'automol.formula',
-                'automol.geom',
-                'automol.graph',
-                'automol.mult',
-                'automol.pot',
-                'automol.prop',
-                'automol.reac',
-                'automol.rotor',
-                'automol.zmat',
-                'automol.util',
-                'automol.util.dict_',
-                'phydat',
-                'transformations'],
+      packages=find_packages(include=['automol', 'automol.*',
+                                      'phydat', 'transformations']),
       package_dir={'automol': 'automol',
                    'phydat': 'phydat',
                    'transformations': 'transformations'},